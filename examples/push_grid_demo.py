@@ -13,56 +13,13 @@ if str(REPO_ROOT) not in sys.path:
 from mts.io.loaders import load_scales, load_chord_qualities
 from mts.core.chord import Chord
 from mts.core.enharmonics import pc_from_name
-from mts.layouts.push_grid import PushGrid
-
-
-def _paint(text: str, *, fg: str | None = None, bold: bool = False, dim: bool = False) -> str:
-    ansi = {
-        "reset": "\x1b[0m",
-        "bold": "\x1b[1m",
-        "dim": "\x1b[2m",
-        "fg_bright_magenta": "\x1b[95m",
-        "fg_bright_cyan": "\x1b[96m",
-        "fg_cyan": "\x1b[36m",
-        "fg_bright_yellow": "\x1b[93m",
-        "fg_bright_red": "\x1b[91m",
-        "fg_yellow": "\x1b[33m",
-        "fg_red": "\x1b[31m",
-        "fg_white": "\x1b[37m",
-        "fg_bright_black": "\x1b[90m",
-    }
-    parts: list[str] = []
-    if bold:
-        parts.append(ansi["bold"])
-    if dim:
-        parts.append(ansi["dim"])
-    if fg:
-        parts.append(ansi.get(fg, ""))
-    if not parts:
-        return text
-    return "".join(parts) + text + ansi["reset"]
+from mts.cli._ansi import LEGEND_COLOR, LEGEND_PLAIN, stdout_is_tty
+from mts.cli.push_grid import PushGrid
 
 
 def format_legend(grid: PushGrid) -> str:
-    use_color = grid.color_mode == "always" or (grid.color_mode == "auto" and sys.stdout.isatty())
-    if use_color:
-        return (
-            "Legend: "
-            + _paint("tonic + chord root", fg="fg_bright_magenta", bold=True) + ", "
-            + _paint("tonic in chord", fg="fg_bright_cyan", bold=True) + ", "
-            + _paint("tonic", fg="fg_cyan", bold=True) + ", "
-            + _paint("chord root (in key)", fg="fg_bright_yellow", bold=True) + ", "
-            + _paint("chord root (out of key)", fg="fg_bright_red", bold=True) + ", "
-            + _paint("chord tone (in key)", fg="fg_yellow", bold=True) + ", "
-            + _paint("chord tone (out of key)", fg="fg_red", bold=True) + ", "
-            + _paint("in key", fg="fg_white") + ", "
-            + _paint("out of key", fg="fg_bright_black", dim=True)
-        )
-    return (
-        "Legend: tonic + chord root, tonic in chord, tonic, "
-        "chord root (in key), chord root (out of key), chord tone (in key), "
-        "chord tone (out of key), in key, out of key"
-    )
+    use_color = grid.color_mode == "always" or (grid.color_mode == "auto" and stdout_is_tty())
+    return LEGEND_COLOR if use_color else LEGEND_PLAIN
 
 
 def print_section(title: str) -> None:
@@ -79,22 +36,23 @@ def show_grid(
     cli_command: str | None = None,
     show_blocks: bool = False,
 ) -> None:
-    print_section(title)
+    # Collected and written once, so a repaint is one stream write rather
+    # than a flush per grid row.
+    out = ["", title, "=" * len(title)]
     if chord_label:
         descriptor = chord_label
         if chord_intervals:
             descriptor = f"{descriptor} (intervals: {chord_intervals})"
-        print(f"Chord: {descriptor}")
-    print(format_legend(grid))
-    for line in grid.render_lines():
-        print(line)
+        out.append(f"Chord: {descriptor}")
+    out.append(format_legend(grid))
+    out.extend(grid.render_lines())
     if show_blocks:
-        print("\nSymbol grid:")
-        for line in grid.render_block_lines():
-            print(line)
+        out.append("\nSymbol grid:")
+        out.extend(grid.render_block_lines())
     if cli_command:
-        print("\nCommand:")
-        print(cli_command)
+        out.append("\nCommand:")
+        out.append(cli_command)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def describe_intervals(chord: Chord) -> str:
@@ -25,7 +25,7 @@ from .errors import InsufficientInformation, SpecificationError, require_realiza
 from ..core.realization import Realization
 from ..core.spec_level import Registral, SpecLevel, Transpositional
 from .summaries import ChordBrief, chord_brief
-from ..core.pitch import Pitch, parse_pitch_token, ParsedPitch
+from ..core.pitch import Pitch, parse_pitch_token, parse_pitch_tokens, ParsedPitch
 from ..session import (
     ManualScaleBuilder,
     ManualChordBuilder,
@@ -157,6 +157,7 @@ __all__ = [
     "NamingUnderKey",
     "RankedInterpretation",
     "parse_pitch_token",
+    "parse_pitch_tokens",
     "chord_brief",
     "parse_chord_spec",
     "compare_chord_qualities",
@@ -12,13 +12,15 @@ from __future__ import annotations
 import itertools
 from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 
+from ..core.bitmask import interval_vector_from_mask, mask_from_pcs, pcs_from_mask
 from ..core.chord import Chord
 from ..core.realization import Realization
 from ..core.symmetry import rotational_period, rotational_steps
 from .errors import require_realization
 from .pcset_math import interval_vector as _interval_vector
-from .pcset_math import reflection_axes as _reflection_axes
+from .pcset_math import reflection_axes_of_mask as _reflection_axes_of_mask
 from .pcset_math import set_class_data, tonnetz_coordinates
 from .voicings import voicing_shapes
 from .results import (
@@ -32,7 +34,7 @@ from .results import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ChordAnalysisRequest:
     """Container for chord analysis instructions.
 
@@ -72,9 +74,8 @@ def _symmetry_data(chord: Chord) -> SymmetryData:
     # No empty-set special case: core's convention applies (the empty set is
     # trivially invariant — period 1, every step; the old hardcoded period 0
     # disagreed with core and the exported set-class table).
-    pcs = set(chord.pcs)
     mask = chord.mask
-    reflection_axes = _reflection_axes(pcs)
+    reflection_axes = _reflection_axes_of_mask(mask)
     return SymmetryData(
         rotational_period=rotational_period(mask),
         rotational_steps=list(rotational_steps(mask)),
@@ -83,6 +84,14 @@ def _symmetry_data(chord: Chord) -> SymmetryData:
     )
 
 
+@lru_cache(maxsize=4096)
+def _pairwise_intervals_for_mask(mask: int) -> tuple[int, ...]:
+    # Sorted ascending-pair intervals of a pc-set: a pure function of the
+    # mask, so the C(n, 2) pair walk runs once per identity.
+    unique = pcs_from_mask(mask)
+    return tuple(sorted(((b - a) % 12) for a, b in itertools.combinations(unique, 2)))
+
+
 def _interval_summary(pcs: list[int]) -> ChordIntervalSummary:
     if not pcs:
         return ChordIntervalSummary(
@@ -96,8 +105,9 @@ def _interval_summary(pcs: list[int]) -> ChordIntervalSummary:
             interval_pairs=[],
         )
     unique = sorted({pc % 12 for pc in pcs})
-    vector = _interval_vector(unique)
-    pairwise = sorted(((b - a) % 12) for a, b in itertools.combinations(unique, 2))
+    mask = mask_from_pcs(unique)
+    vector = list(interval_vector_from_mask(mask))
+    pairwise = list(_pairwise_intervals_for_mask(mask))
     nonzero = [iv for iv in pairwise if iv != 0]
     smallest = min(nonzero) if nonzero else None
     largest = max(nonzero) if nonzero else None
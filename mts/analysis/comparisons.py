@@ -68,7 +68,6 @@ def compare_chord_qualities(
     """Compare two chord qualities across the scale catalog."""
 
     if catalog_scales is None:
-
         catalog_scales = load_scales()
 
     scales = dict(catalog_scales)
@@ -15,6 +15,7 @@ from functools import lru_cache
 
 from ..core.bitmask import (
     interval_vector_from_mask,
+    invert_mask,
     is_subset,
     mask_from_pcs,
     pcs_from_mask,
@@ -61,24 +62,18 @@ def trichord_chirality(mask: int) -> int | None:
 
 @lru_cache(maxsize=4096)
 def _reflection_axes_for_mask(mask: int) -> tuple[ReflectionAxis, ...]:
-    pcs = set(pcs_from_mask(mask))
+    # Reflection about axis a is the inversion I_n with n = 2a (through a pc)
+    # or n = 2a + 1 (between two pcs), so each axis is one table-backed
+    # invert_mask compare — no per-axis set building. Axes a and a + 6 share
+    # an index and are both reported, as before.
+    invariant = [invert_mask(mask, index) == mask for index in range(12)]
     axes: list[ReflectionAxis] = []
     for axis in range(12):
-        reflected_pitch = {((2 * axis - pc) % 12) for pc in pcs}
-        if reflected_pitch == pcs:
+        if invariant[(2 * axis) % 12]:
             axes.append(ReflectionAxis(type="pitch", center=axis))
-        reflected_between = {((2 * axis + 1 - pc) % 12) for pc in pcs}
-        if reflected_between == pcs:
+        if invariant[(2 * axis + 1) % 12]:
             axes.append(ReflectionAxis(type="between", center=(axis + 0.5) % 12))
-    unique_axes: list[ReflectionAxis] = []
-    seen: set[tuple[str, float]] = set()
-    for ax in axes:
-        key = (ax.type, ax.center)
-        if key in seen:
-            continue
-        seen.add(key)
-        unique_axes.append(ax)
-    return tuple(unique_axes)
+    return tuple(axes)
 
 
 def reflection_axes(pcs: set[int]) -> list[ReflectionAxis]:
@@ -87,9 +82,25 @@ def reflection_axes(pcs: set[int]) -> list[ReflectionAxis]:
     ``ReflectionAxis`` is frozen, so the cached instances are shared safely.
     """
 
-    if not pcs:
+    return reflection_axes_of_mask(mask_from_pcs(pcs))
+
+
+def reflection_axes_of_mask(mask: int) -> list[ReflectionAxis]:
+    """Mask form of :func:`reflection_axes`, for callers already holding the key.
+
+    Skips the pcs → set → mask round-trip; the empty set reports no axes.
+    """
+
+    if not mask:
         return []
-    return list(_reflection_axes_for_mask(mask_from_pcs(pcs)))
+    return list(_reflection_axes_for_mask(mask))
+
+
+@lru_cache(maxsize=4096)
+def _transpositions_of_mask(mask: int) -> tuple[int, ...]:
+    """The 12 transpositions of *mask*, indexed by root (T0..T11)."""
+
+    return tuple(rotate_mask(mask, root) for root in range(12))
 
 
 # Pair-keyed cache (RE-5e): the key space is mask *pairs*, not single masks, so
@@ -98,8 +109,8 @@ def reflection_axes(pcs: set[int]) -> list[ReflectionAxis]:
 def _compatibility_roots_for_masks(scale_mask: int, quality_mask: int) -> tuple[int, ...]:
     return tuple(
         root
-        for root in range(12)
-        if is_subset(rotate_mask(quality_mask, root), scale_mask)
+        for root, rotated in enumerate(_transpositions_of_mask(quality_mask))
+        if is_subset(rotated, scale_mask)
     )
 
 
@@ -109,6 +120,26 @@ def compatibility_roots(scale: Scale, quality: ChordQuality) -> tuple[int, ...]:
     return _compatibility_roots_for_masks(scale.mask, quality.mask)
 
 
+def compatibility_roots_across(
+    scale_masks: Iterable[int], quality_mask: int
+) -> list[tuple[int, ...]]:
+    """:func:`compatibility_roots` for many scales against one quality.
+
+    The quality's transpositions are fetched once, and each scale is then
+    twelve AND-tests against its complement — no per-pair cache traffic when
+    sweeping a whole catalog.
+    """
+
+    transpositions = _transpositions_of_mask(quality_mask)
+    roots: list[tuple[int, ...]] = []
+    for scale_mask in scale_masks:
+        outside = ~scale_mask & 0xFFF
+        roots.append(
+            tuple(root for root, rotated in enumerate(transpositions) if not rotated & outside)
+        )
+    return roots
+
+
 # Pair-keyed cache (RE-5e): mask-pair key space — 16384, not 4096.
 @lru_cache(maxsize=16384)
 def _containing_roots_for_masks(container_mask: int, query_mask: int) -> tuple[int, ...]:
@@ -8,12 +8,13 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 
-from ..core.bitmask import mask_from_pcs
+from ..core.bitmask import interval_vector_from_mask, mask_from_pcs, pcs_from_mask
 from ..core.scale import Scale
 from ..core.symmetry import rotational_steps
 from .pcset_math import interval_vector as _interval_vector
-from .pcset_math import reflection_axes as _reflection_axes
+from .pcset_math import reflection_axes_of_mask as _reflection_axes_of_mask
 from .pcset_math import set_class_data
 from .results import (
     ModeRotation,
@@ -23,7 +24,7 @@ from .results import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ScaleAnalysisRequest:
     """Container for ad hoc scale analysis instructions."""
 
@@ -63,32 +64,55 @@ def _step_pattern(degrees: Iterable[int]) -> list[int]:
     ``degrees``; each mode's root-anchored pattern lives in the ``modes`` list).
     The old form anchored at the numerically-smallest pc — an artifact of 12-TET
     numbering that made it neither invariant nor tonic-anchored."""
-    steps = _ascending_steps(degrees)
+    return list(_step_pattern_for_mask(mask_from_pcs({int(pc) % 12 for pc in degrees})))
+
+
+@lru_cache(maxsize=4096)
+def _step_pattern_for_mask(mask: int) -> tuple[int, ...]:
+    # Mask-keyed like ``interval_vector_from_mask``: only 4096 identities, so
+    # each canonical rotation is computed at most once per process.
+    steps = _ascending_steps(pcs_from_mask(mask))
     if not steps:
-        return []
-    return min(steps[i:] + steps[:i] for i in range(len(steps)))
+        return ()
+    return tuple(min(steps[i:] + steps[:i] for i in range(len(steps))))
 
 
 def _modal_rotations(scale: Scale) -> list[ModeRotation]:
-    if not scale.degrees:
-        return []
-    rotations: list[ModeRotation] = []
-    degrees = list(scale.degrees)
-    for mode_index, root in enumerate(degrees):
+    # Results are built fresh per call (list fields stay unshared); only the
+    # immutable per-mask rows are cached.
+    return [
+        ModeRotation(
+            mode_index=mode_index,
+            root_pc=root,
+            degrees=list(rotated),
+            mask=rotated_mask,
+            step_pattern=list(pattern),
+            interval_vector=list(vector),
+        )
+        for mode_index, (root, rotated, rotated_mask, pattern, vector) in enumerate(
+            _modal_rotation_rows(scale.mask)
+        )
+    ]
+
+
+@lru_cache(maxsize=4096)
+def _modal_rotation_rows(
+    mask: int,
+) -> tuple[tuple[int, tuple[int, ...], int, tuple[int, ...], tuple[int, ...]], ...]:
+    degrees = pcs_from_mask(mask)
+    rows = []
+    for root in degrees:
         rotated = sorted(((pc - root) % 12 for pc in degrees))
-        pattern = _ascending_steps(rotated)
-        vector = _interval_vector(rotated)
-        rotations.append(
-            ModeRotation(
-                mode_index=mode_index,
-                root_pc=root,
-                degrees=rotated,
-                mask=mask_from_pcs(rotated),
-                step_pattern=pattern,
-                interval_vector=vector,
+        rows.append(
+            (
+                root,
+                tuple(rotated),
+                mask_from_pcs(rotated),
+                tuple(_ascending_steps(rotated)),
+                tuple(_interval_vector(rotated)),
             )
         )
-    return rotations
+    return tuple(rows)
 
 
 def _symmetry_data(scale: Scale) -> SymmetryData:
@@ -96,7 +120,7 @@ def _symmetry_data(scale: Scale) -> SymmetryData:
     # trivially invariant — period 1, every step; the old hardcoded period 0
     # disagreed with core and the exported set-class table).
     mask = scale.mask
-    reflection_axes = _reflection_axes(set(scale.degrees))
+    reflection_axes = _reflection_axes_of_mask(mask)
     return SymmetryData(
         rotational_period=scale.rotational_period,
         rotational_steps=list(rotational_steps(mask)),
@@ -136,9 +160,10 @@ def _interval_summary(step_pattern: list[int], interval_vector: list[int]) -> Sc
 def analyze_scale(request: ScaleAnalysisRequest) -> ScaleAnalysisResult:
     """Return a typed analysis result for the given scale."""
 
-    normalized_degrees = _normalize_degrees(request.scale.degrees)
-    step_pattern = _step_pattern(normalized_degrees)
-    interval_vector = _interval_vector(normalized_degrees)
+    # Scale degrees are already normalized into the mask, so both shape
+    # descriptors read straight from their per-mask caches.
+    step_pattern = list(_step_pattern_for_mask(request.scale.mask))
+    interval_vector = list(interval_vector_from_mask(request.scale.mask))
 
     modes: list[ModeRotation] | None = None
     if request.include_modes:
@@ -160,9 +185,8 @@ def analyze_scale(request: ScaleAnalysisRequest) -> ScaleAnalysisResult:
         step_pattern=step_pattern,
         interval_vector=interval_vector,
         mask=request.scale.mask,
-        mask_binary="".join(
-            "1" if request.scale.mask & (1 << pc) else "0" for pc in range(12)
-        ),
+        # pc 0 first (LSB-left), hence the reversal of the MSB-first format.
+        mask_binary=format(request.scale.mask, "012b")[::-1],
         modes=modes,
         symmetry=symmetry,
         intervals=intervals,
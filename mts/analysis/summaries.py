@@ -3,17 +3,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Mapping, Any
+from functools import lru_cache
+from typing import Iterable, Mapping
 
 from .chord_analysis import ChordAnalysisRequest, analyze_chord
-from .pcset_math import compatibility_roots as _compatibility_roots
+from .pcset_math import compatibility_roots_across as _compatibility_roots_across
+from ..core.bitmask import pcs_from_mask
 from ..core.chord import Chord
 from ..core.quality import ChordQuality
 from ..core.scale import Scale
 from ..io.loaders import load_function_mappings, load_scales
 
 
-@dataclass
+@dataclass(slots=True)
 class ChordBrief:
     interval_fingerprint: str
     compatible_scales: list[str]
@@ -34,34 +36,15 @@ class ChordBrief:
         return lines
 
 
-def _function_mappings(mode: str) -> list[Any]:
-    # The loader is cached now (RE-5b) — the local lru_cache workaround is gone.
-
-    return load_function_mappings(mode)
-
-
 def chord_brief(
     quality: ChordQuality,
     *,
     catalog_scales: Mapping[str, Scale] | None = None,
     max_scales: int = 3,
 ) -> ChordBrief:
-    chord = Chord.from_quality(0, quality)
-    analysis = analyze_chord(
-        ChordAnalysisRequest(
-            chord=chord,
-            include_inversions=True,
-        )
-    )
-
-    histogram: dict[int, int] = analysis.interval_class_histogram
-    fingerprint = _format_interval_fingerprint(histogram, limit=3)
-
-    if catalog_scales is None:
+    fingerprint = _interval_fingerprint_for_mask(quality.mask)
 
-        scales = load_scales()
-    else:
-        scales = catalog_scales
+    scales = load_scales() if catalog_scales is None else catalog_scales
     compatible = _compatibility_snapshot(quality, scales.values(), max_scales=max_scales)
 
     roles = _functional_alignment(quality.name)
@@ -73,9 +56,29 @@ def chord_brief(
     )
 
 
+@lru_cache(maxsize=4096)
+def _interval_fingerprint_for_mask(mask: int) -> str:
+    # The fingerprint is a pure function of the quality's identity key, so the
+    # full chord analysis (inversions, set class, Tonnetz…) it used to be read
+    # from runs at most once per mask.
+    quality = ChordQuality.from_intervals("", pcs_from_mask(mask))
+    analysis = analyze_chord(
+        ChordAnalysisRequest(
+            chord=Chord.from_quality(0, quality),
+            include_inversions=False,
+            include_set_class=False,
+        )
+    )
+    return _format_interval_fingerprint(analysis.interval_class_histogram, limit=3)
+
+
+# One shared label per interval class (ic1..ic6), indexed by ic.
+_IC_PREFIX = ("",) + tuple(f"ic{ic}:" for ic in range(1, 7))
+
+
 def _format_interval_fingerprint(histogram: dict[int, int], limit: int) -> str:
     ordered = sorted(histogram.items(), key=lambda item: (-item[1], item[0]))
-    parts = [f"ic{ic}:{count}" for ic, count in ordered if count > 0]
+    parts = [_IC_PREFIX[ic] + str(count) for ic, count in ordered if count > 0]
     if len(parts) > limit:
         parts = parts[:limit]
     return ", ".join(parts) if parts else "none"
@@ -87,14 +90,11 @@ def _compatibility_snapshot(
     *,
     max_scales: int,
 ) -> list[str]:
-    snapshot: list[tuple[str, tuple[int, ...]]] = []
-    for scale in scales:
-        if scale.name.lower() == "chromatic":
-            continue
-        roots = _compatibility_roots(scale, quality)
-        if not roots:
-            continue
-        snapshot.append((scale.name, roots))
+    candidates = [scale for scale in scales if scale.name.lower() != "chromatic"]
+    all_roots = _compatibility_roots_across((scale.mask for scale in candidates), quality.mask)
+    snapshot: list[tuple[str, tuple[int, ...]]] = [
+        (scale.name, roots) for scale, roots in zip(candidates, all_roots) if roots
+    ]
     snapshot.sort(key=lambda item: (-len(item[1]), item[0]))
     formatted: list[str] = []
     for name, roots in snapshot[:max_scales]:
@@ -103,12 +103,29 @@ def _compatibility_snapshot(
     return formatted
 
 
+# ((major mappings, minor mappings), {quality name: descriptors}). Keyed on the
+# loader's cached lists themselves, so an mtime reload rebuilds the index.
+_ROLE_INDEX_CACHE: tuple[tuple[list, list], dict[str, tuple[str, ...]]] | None = None
+
+
+def _role_index() -> dict[str, tuple[str, ...]]:
+    global _ROLE_INDEX_CACHE
+    sources = (load_function_mappings("major"), load_function_mappings("minor"))
+    cached = _ROLE_INDEX_CACHE
+    if cached is not None and all(a is b for a, b in zip(cached[0], sources)):
+        return cached[1]
+
+    grouped: dict[str, list[str]] = {}
+    for mode, mappings in zip(("major", "minor"), sources):
+        for mapping in mappings:
+            descriptor = f"{mode}: {mapping.modal_label} ({mapping.role})"
+            roles = grouped.setdefault(mapping.chord_quality, [])
+            if descriptor not in roles:
+                roles.append(descriptor)
+    index = {name: tuple(roles) for name, roles in grouped.items()}
+    _ROLE_INDEX_CACHE = (sources, index)
+    return index
+
+
 def _functional_alignment(chord_quality_name: str) -> list[str]:
-    roles: list[str] = []
-    for mode in ("major", "minor"):
-        for mapping in _function_mappings(mode):
-            if mapping.chord_quality == chord_quality_name:
-                descriptor = f"{mode}: {mapping.modal_label} ({mapping.role})"
-                if descriptor not in roles:
-                    roles.append(descriptor)
-    return roles
+    return list(_role_index().get(chord_quality_name, ()))
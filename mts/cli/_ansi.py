@@ -0,0 +1,74 @@
+"""ANSI styling shared by the demoted terminal Push grid and its CLI."""
+
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+
+_ANSI = {
+    "reset": "\x1b[0m",
+    "bold": "\x1b[1m",
+    "dim": "\x1b[2m",
+    "fg_black": "\x1b[30m",
+    "fg_red": "\x1b[31m",
+    "fg_green": "\x1b[32m",
+    "fg_yellow": "\x1b[33m",
+    "fg_blue": "\x1b[34m",
+    "fg_magenta": "\x1b[35m",
+    "fg_cyan": "\x1b[36m",
+    "fg_white": "\x1b[37m",
+    "fg_bright_black": "\x1b[90m",
+    "fg_bright_red": "\x1b[91m",
+    "fg_bright_green": "\x1b[92m",
+    "fg_bright_yellow": "\x1b[93m",
+    "fg_bright_blue": "\x1b[94m",
+    "fg_bright_magenta": "\x1b[95m",
+    "fg_bright_cyan": "\x1b[96m",
+    "fg_bright_white": "\x1b[97m",
+}
+
+
+_RESET = _ANSI["reset"]
+
+
+@lru_cache(maxsize=None)
+def _prefix(fg: str | None, bold: bool, dim: bool) -> str:
+    # Only a few dozen (fg, bold, dim) styles exist, so each escape prefix
+    # is joined once rather than per painted token.
+    return (_ANSI["bold"] if bold else "") + (_ANSI["dim"] if dim else "") + (_ANSI[fg] if fg else "")
+
+
+def _paint(s: str, *, fg: str | None = None, bold: bool = False, dim: bool = False) -> str:
+    prefix = _prefix(fg, bold, dim)
+    return prefix + s + _RESET if prefix else s
+
+
+def stdout_is_tty() -> bool:
+    """Whether the current ``sys.stdout`` is a terminal, asked fresh each call.
+
+    Nothing is cached, so a swapped-in stdout (tests, pipes) is never given a
+    stale answer; callers resolve it once per invocation instead.
+    """
+
+    return sys.stdout.isatty()
+
+
+# The legend never depends on arguments beyond colour on/off, so both
+# renderings are built once at import.
+LEGEND_COLOR = (
+    "Legend: "
+    + _paint("tonic + chord root", fg="fg_bright_magenta", bold=True) + ", "
+    + _paint("tonic in chord", fg="fg_bright_cyan", bold=True) + ", "
+    + _paint("tonic", fg="fg_cyan", bold=True) + ", "
+    + _paint("chord root (in key)", fg="fg_bright_yellow", bold=True) + ", "
+    + _paint("chord root (out of key)", fg="fg_bright_red", bold=True) + ", "
+    + _paint("chord tone (in key)", fg="fg_yellow", bold=True) + ", "
+    + _paint("chord tone (out of key)", fg="fg_red", bold=True) + ", "
+    + _paint("in key", fg="fg_white") + ", "
+    + _paint("out of key", fg="fg_bright_black", dim=True)
+)
+LEGEND_PLAIN = (
+    "Legend: tonic + chord root, tonic in chord, tonic, "
+    "chord root (in key), chord root (out of key), "
+    "chord tone (in key), chord tone (out of key), in key, out of key"
+)
@@ -2,14 +2,18 @@ from __future__ import annotations
 
 import argparse
 import sys
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping, Sequence
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
-from ..io.loaders import load_scales, load_chord_qualities, load_function_mappings, FunctionMapping
+from ..io.loaders import load_scales, load_chord_qualities
+from ..core.bitmask import rotate_mask
 from ..core.chord import Chord
 from ..core.quality import ChordQuality
 from ..core.enharmonics import pc_from_name
+from ._ansi import LEGEND_COLOR, LEGEND_PLAIN, _paint, stdout_is_tty
 from .push_grid import PushGrid
-from ..theory import functions as fn_defs
 from ..analysis import ChordAnalysisRequest, analyze_chord
 from ..analysis.voicings import suggest_voicings
 from ..session import SessionCatalog, SESSION_FILE
@@ -20,26 +24,42 @@ _session = SessionCatalog()
 _session.load(SESSION_FILE)
 from ..context import DisplayContext
 from ..context.formatters import (
-    format_pitch_class,
+    format_pcs,
     update_context_with_scale,
     update_context_with_chord_root,
 )
 
-_FUNCTION_FEATURE_CHOICES = sorted(
-    {
-        fn_defs.FEATURE_ADDED_TONES,
-        fn_defs.FEATURE_ALTERED_DOMINANT,
-        fn_defs.FEATURE_EXTENDED,
-        fn_defs.FEATURE_LEADING_TONE,
-        fn_defs.FEATURE_LYDIAN_EXTENSIONS,
-        fn_defs.FEATURE_POWER_DYADS,
-        fn_defs.FEATURE_RAISED_SIXTH,
-        fn_defs.FEATURE_SIXTH_CHORDS,
-        fn_defs.FEATURE_SUSPENDED,
-        fn_defs.FEATURE_PARALLEL_MAJOR,
-        fn_defs.FEATURE_PARALLEL_MINOR,
-    }
+if TYPE_CHECKING:
+    from ..io.loaders import FunctionMapping
+
+
+# The opt-in features of theory.functions (everything but the always-on
+# "diatonic"), spelled out so no set/sort runs at import; a test keeps this
+# in step with the FEATURE_* constants.
+_FUNCTION_FEATURE_CHOICES = (
+    "added_tones",
+    "altered_dominant",
+    "extended",
+    "leading_tone",
+    "lydian_extensions",
+    "parallel_major",
+    "parallel_minor",
+    "power_dyads",
+    "raised_sixth",
+    "sixth_chords",
+    "suspended",
 )
+_FUNCTION_FEATURE_SET = frozenset(_FUNCTION_FEATURE_CHOICES)
+
+
+def _function_feature(value: str) -> str:
+    # argparse's own ``choices`` check is a linear scan re-run for every
+    # repeated --functions-feature; validate against the frozenset instead,
+    # keeping argparse's wording and the tuple's stable order in messages/help.
+    if value not in _FUNCTION_FEATURE_SET:
+        options = ", ".join(repr(choice) for choice in _FUNCTION_FEATURE_CHOICES)
+        raise argparse.ArgumentTypeError(f"invalid choice: {value!r} (choose from {options})")
+    return value
 
 
 def _infer_function_mode(scale_name: str) -> str | None:
@@ -65,20 +85,22 @@ def _print_function_catalog(mode: str, mappings: Iterable[FunctionMapping]) -> N
             f"{tags}"
         )
 
-def _positive_int_or_none(v: str | None) -> int | None:
-    if v is None:
-        return None
-    return int(v)
-
 ROMANS = ["I", "II", "III", "IV", "V", "VI", "VII"]
 
 
-def _relative_degree_label(relative_pc: int, scale_degrees: list[int]) -> str:
-    if relative_pc in scale_degrees:
-        idx = scale_degrees.index(relative_pc)
-        if 0 <= idx < len(ROMANS):
-            return ROMANS[idx]
-    return f"pc{relative_pc}"
+@lru_cache(maxsize=256)
+def _roman_by_degree(scale_degrees: tuple[int, ...]) -> Mapping[int, str]:
+    # First occurrence wins, as list.index did; degrees past VII get no numeral.
+    labels: dict[int, str] = {}
+    for idx, degree in enumerate(scale_degrees[: len(ROMANS)]):
+        labels.setdefault(degree, ROMANS[idx])
+    # Read-only: the cached mapping is shared by every caller.
+    return MappingProxyType(labels)
+
+
+def _relative_degree_label(relative_pc: int, scale_degrees: Sequence[int]) -> str:
+    label = _roman_by_degree(tuple(scale_degrees)).get(relative_pc)
+    return f"pc{relative_pc}" if label is None else label
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -134,7 +156,8 @@ def build_arg_parser() -> argparse.ArgumentParser:
                    help="Template set to use when listing functional mappings. "
                         "Defaults to both major and minor unless specified.")
     p.add_argument("--functions-feature", action="append", default=[],
-                   choices=_FUNCTION_FEATURE_CHOICES,
+                   type=_function_feature,
+                   metavar="{" + ",".join(_FUNCTION_FEATURE_CHOICES) + "}",
                    help="Enable additional functional features (repeatable).")
     p.add_argument("--functions-include-borrowed", dest="functions_include_borrowed",
                    action="store_true", default=None,
@@ -145,6 +168,13 @@ def build_arg_parser() -> argparse.ArgumentParser:
     return p
 
 
+@lru_cache(maxsize=1)
+def _arg_parser() -> argparse.ArgumentParser:
+    # Shared by repeat main() calls (parse_args never mutates the parser);
+    # build_arg_parser() itself still hands callers a fresh, private parser.
+    return build_arg_parser()
+
+
 def _session_chord_summary(quality: ChordQuality) -> str:
     chord = Chord.from_quality(0, quality)
     analysis = analyze_chord(
@@ -162,8 +192,37 @@ def _session_chord_summary(quality: ChordQuality) -> str:
     inversion_count = len(analysis.inversions or [])
     return f"{inversion_count} inversions, voicings -> {voicing_text}"
 
+@lru_cache(maxsize=4096)
+def _chord_for(root_pc: int, quality: ChordQuality) -> Chord:
+    # Chord is frozen, so one instance per (root, quality) is safely shared.
+    return Chord.from_quality(root_pc, quality)
+
+
+def _resolve_chord(
+    args: argparse.Namespace, qualities: dict[str, ChordQuality]
+) -> tuple[str, Chord] | None:
+    """``(label, chord)`` from ``--chord Root:Quality`` or ``--chord-root`` +
+    ``--chord-quality``; ``None`` when no chord was asked for."""
+    if args.chord:
+        # Parse "Root:Quality"
+        if ":" not in args.chord:
+            raise SystemExit("Use --chord in the form 'Root:Quality', e.g., 'C:maj7' or 'G:7'.")
+        root_str, qual_str = args.chord.split(":", 1)
+        root_name, quality_name = root_str.strip(), qual_str.strip()
+        unknown = f"Unknown chord quality {qual_str!r}. Use --list-qualities to see options."
+    elif args.chord_root and args.chord_quality:
+        root_name, quality_name = args.chord_root, args.chord_quality
+        unknown = f"Unknown chord quality {args.chord_quality!r}. Use --list-qualities."
+    else:
+        return None
+    root_pc = pc_from_name(root_name)
+    if quality_name not in qualities:
+        raise SystemExit(unknown)
+    return f"{root_name}{quality_name}", _chord_for(root_pc, qualities[quality_name])
+
+
 def main(argv: list[str] | None = None) -> None:
-    args = build_arg_parser().parse_args(argv)
+    args = _arg_parser().parse_args(argv)
 
     # Load data
     scales = load_scales()
@@ -181,6 +240,8 @@ def main(argv: list[str] | None = None) -> None:
             print(" -", name)
         return
     if args.list_functions:
+        from ..io.loaders import load_function_mappings
+
         if args.functions_mode:
             mode_selection = ["major", "minor"] if args.functions_mode == "both" else [args.functions_mode]
         else:
@@ -209,7 +270,7 @@ def main(argv: list[str] | None = None) -> None:
     if args.scale not in scales:
         raise SystemExit(f"Unknown scale {args.scale!r}. Use --list-scales to see options.")
     scale = scales[args.scale]
-    scale_degrees = list(scale.degrees)
+    scale_degrees = scale.degrees  # already a normalized tuple; read-only below
 
     update_context_with_scale(context, tonic_pc, scale_degrees)
     context.set("key_signature", args.key_sig, layer="cli")
@@ -223,30 +284,13 @@ def main(argv: list[str] | None = None) -> None:
     chord_context = None
     chord_root_pc: int | None = None
 
-    if args.chord:
-        # Parse "Root:Quality"
-        if ":" not in args.chord:
-            raise SystemExit("Use --chord in the form 'Root:Quality', e.g., 'C:maj7' or 'G:7'.")
-        root_str, qual_str = args.chord.split(":", 1)
-        chord_root_pc = pc_from_name(root_str.strip())
-        if qual_str.strip() not in qualities:
-            raise SystemExit(f"Unknown chord quality {qual_str!r}. Use --list-qualities to see options.")
-        chord = Chord.from_quality(chord_root_pc, qualities[qual_str.strip()])
-        chord_label = f"{root_str.strip()}{qual_str.strip()}"
-        chord_pcs = list(chord.pcs)
-        update_context_with_chord_root(context, chord_root_pc)
-        chord_spelling = [format_pitch_class(pc, context) for pc in chord_pcs]
-        chord_quality = chord.quality
-        chord_context = _session.chord_context.get(chord_quality.name)
-    elif args.chord_root and args.chord_quality:
-        chord_root_pc = pc_from_name(args.chord_root)
-        if args.chord_quality not in qualities:
-            raise SystemExit(f"Unknown chord quality {args.chord_quality!r}. Use --list-qualities.")
-        chord = Chord.from_quality(chord_root_pc, qualities[args.chord_quality])
-        chord_label = f"{args.chord_root}{args.chord_quality}"
+    resolved = _resolve_chord(args, qualities)
+    if resolved is not None:
+        chord_label, chord = resolved
+        chord_root_pc = chord.root_pc
         chord_pcs = list(chord.pcs)
         update_context_with_chord_root(context, chord_root_pc)
-        chord_spelling = [format_pitch_class(pc, context) for pc in chord_pcs]
+        chord_spelling = format_pcs(chord_pcs, context, mode="names")
         chord_quality = chord.quality
         chord_context = _session.chord_context.get(chord_quality.name)
     else:
@@ -268,41 +312,26 @@ def main(argv: list[str] | None = None) -> None:
 
     # --- In-scale sanity check: warn or error if chord contains out-of-key tones ---
     if args.mode == "in_scale" and chord_pcs:
-        relset = set(scale_degrees)  # degrees relative to tonic (0..11)
-        # find out-of-key chord pcs relative to tonic
-        ook_abs = [pc for pc in chord_pcs if ((pc - tonic_pc) % 12) not in relset]
-
-        if ook_abs:
-            # pretty-print names with current spelling prefs
-            ook_names = [format_pitch_class(pc, context) for pc in ook_abs]
-            root_is_ook = chord_root_pc is not None and (((chord_root_pc - tonic_pc) % 12) not in relset)
-
-            # tiny ANSI helper (CLI-only)
-            def _warn_paint(text, *, fg=None, bold=False, dim=False):
-                ANSI = {
-                    "reset": "\x1b[0m", "bold": "\x1b[1m", "dim": "\x1b[2m",
-                    "fg_yellow": "\x1b[33m", "fg_red": "\x1b[31m",
-                    "fg_bright_red": "\x1b[91m", "fg_bright_black": "\x1b[90m",
-                }
-                parts = []
-                if bold:
-                    parts.append(ANSI["bold"])
-                if dim:
-                    parts.append(ANSI["dim"])
-                if fg:
-                    parts.append(ANSI[fg])
-                return ("".join(parts) + text + ANSI["reset"]) if parts else text
+        # Both sides as absolute 12-bit masks: the scale transposed to the
+        # tonic, so one AND-NOT finds every out-of-key chord tone.
+        key_mask = rotate_mask(scale.mask, tonic_pc)
+        ook_mask = chord.mask & ~key_mask
+
+        if ook_mask:
+            # pretty-print names with current spelling prefs (chord order kept)
+            ook_names = format_pcs([pc for pc in chord_pcs if ook_mask >> pc & 1], context, mode="names")
+            root_is_ook = chord_root_pc is not None and not key_mask >> chord_root_pc & 1
 
             summary = ", ".join(ook_names)
-            extra = " " + _warn_paint("(root is out of key)", fg="fg_bright_red", bold=True) if root_is_ook else ""
+            extra = " " + _paint("(root is out of key)", fg="fg_bright_red", bold=True) if root_is_ook else ""
 
             print(
-                _warn_paint("Warning: ", fg="fg_yellow", bold=True)
+                _paint("Warning: ", fg="fg_yellow", bold=True)
                 + f"Chord contains out-of-key tones: {summary}{extra}"
             )
             if args.hide_ook:
                 print(
-                    _warn_paint(
+                    _paint(
                         "Note: out-of-key pads will be elided in this view.",
                         fg="fg_bright_black",
                         dim=True,
@@ -311,7 +340,7 @@ def main(argv: list[str] | None = None) -> None:
 
             if args.strict_in_scale:
                 print(
-                    _warn_paint("ERROR: ", fg="fg_bright_red", bold=True)
+                    _paint("ERROR: ", fg="fg_bright_red", bold=True)
                     + "Chord contains out-of-key tones in in_scale mode."
                 )
                 import sys as _sys
@@ -335,96 +364,50 @@ def main(argv: list[str] | None = None) -> None:
         spelling=context.get("spelling", args.spelling),
         key_signature=context.get("key_signature", args.key_sig),
     )
-    g.color_mode = args.color
+    # "auto" is resolved here, once per run; the grid renders then never
+    # ask the terminal again.
+    use_color = (args.color == "always") or (args.color == "auto" and stdout_is_tty())
+    g.color_mode = "always" if use_color else "never"
     g.chord_root_pc = context.get("chord_root_pc")
 
-    # Header
+    # Header, chord line, legend and grid are gathered and written at once.
     if args.degrees:
-        print(f"\nScale: {args.scale} (interval mode)  (degrees: {scale_degrees})")
+        scale_line = f"\nScale: {args.scale} (interval mode)  (degrees: {list(scale_degrees)})"
     else:
-        print(f"\nKey: {args.key}  Scale: {args.scale}  (degrees: {scale_degrees})")
-    print(f"Preset: {args.preset}  Mode: {args.mode}  Anchor: {args.anchor}  Origin: {args.origin}")
+        scale_line = f"\nKey: {args.key}  Scale: {args.scale}  (degrees: {list(scale_degrees)})"
     current_label = context.get("label_mode", "names")
-    print(f"Labels: {current_label}  Spelling: {context.get('spelling', args.spelling)}  KeySig: {context.get('key_signature', args.key_sig)}")
-
-    # Legend (use same ANSI as grid)
-    def _paint(s, *, fg=None, bold=False, dim=False):
-        ANSI = {
-            "reset": "\x1b[0m",
-            "bold": "\x1b[1m",
-            "dim": "\x1b[2m",
-            "fg_black": "\x1b[30m",
-            "fg_red": "\x1b[31m",
-            "fg_green": "\x1b[32m",
-            "fg_yellow": "\x1b[33m",
-            "fg_blue": "\x1b[34m",
-            "fg_magenta": "\x1b[35m",
-            "fg_cyan": "\x1b[36m",
-            "fg_white": "\x1b[37m",
-            "fg_bright_black": "\x1b[90m",
-            "fg_bright_red": "\x1b[91m",
-            "fg_bright_green": "\x1b[92m",
-            "fg_bright_yellow": "\x1b[93m",
-            "fg_bright_blue": "\x1b[94m",
-            "fg_bright_magenta": "\x1b[95m",
-            "fg_bright_cyan": "\x1b[96m",
-            "fg_bright_white": "\x1b[97m",
-        }
-        parts = []
-        if bold:
-            parts.append(ANSI["bold"])
-        if dim:
-            parts.append(ANSI["dim"])
-        if fg:
-            parts.append(ANSI.get(fg, ""))
-        return ("".join(parts) + s + ANSI["reset"]) if parts else s
-
-    use_color = (args.color == "always") or (args.color == "auto" and sys.stdout.isatty())
+    out = [
+        scale_line,
+        f"Preset: {args.preset}  Mode: {args.mode}  Anchor: {args.anchor}  Origin: {args.origin}",
+        f"Labels: {current_label}  Spelling: {context.get('spelling', args.spelling)}  KeySig: {context.get('key_signature', args.key_sig)}",
+    ]
 
     if chord and chord_quality:
         intervals_str = ", ".join(str(iv) for iv in chord_quality.intervals)
-        if args.degrees and 'chord_root_pc' in locals():
+        if args.degrees and chord_root_pc is not None:
             relative_pc = (chord_root_pc - tonic_pc) % 12
             degree_label = _relative_degree_label(relative_pc, scale_degrees)
             chord_display = f"{chord_quality.name} at {degree_label}"
         else:
             chord_display = chord_label
         note_str = ", ".join(chord_spelling)
-        print(f"Chord: {chord_display}  -> notes [{note_str}] intervals [{intervals_str}]")
+        out.append(f"Chord: {chord_display}  -> notes [{note_str}] intervals [{intervals_str}]")
     else:
-        print("Chord: (none)")
-
-    # Print legend (colored if active)
-    if use_color:
-        legend = (
-            "Legend: "
-            + _paint("tonic + chord root", fg="fg_bright_magenta", bold=True) + ", "
-            + _paint("tonic in chord", fg="fg_bright_cyan", bold=True) + ", "
-            + _paint("tonic", fg="fg_cyan", bold=True) + ", "
-            + _paint("chord root (in key)", fg="fg_bright_yellow", bold=True) + ", "
-            + _paint("chord root (out of key)", fg="fg_bright_red", bold=True) + ", "
-            + _paint("chord tone (in key)", fg="fg_yellow", bold=True) + ", "
-            + _paint("chord tone (out of key)", fg="fg_red", bold=True) + ", "
-            + _paint("in key", fg="fg_white") + ", "
-            + _paint("out of key", fg="fg_bright_black", dim=True)
-        )
-    else:
-        legend = (
-            "Legend: tonic + chord root, tonic in chord, tonic, "
-            "chord root (in key), chord root (out of key), "
-            "chord tone (in key), chord tone (out of key), in key, out of key"
-        )
-    print(legend)
+        out.append("Chord: (none)")
 
-    # Render text grid
-    for line in g.render_lines():
-        print(line)
+    # Legend (colored if active)
+    out.append(LEGEND_COLOR if use_color else LEGEND_PLAIN)
+
+    # Text grid
+    out.extend(g.render_lines())
 
     # Optional compact color-block grid
     if args.blocks:
-        print()  # spacer
-        for line in g.render_block_lines(char=args.block_char):
-            print(line)
+        out.append("")  # spacer
+        out.extend(g.render_block_lines(char=args.block_char))
+
+    out.append("")
+    sys.stdout.write("\n".join(out))
 
 if __name__ == "__main__":
     main()
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import sys
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Literal
+from functools import lru_cache
+from typing import Iterator, Literal
 
 from ..representation.push_layout import Push3Layout
-from ..core.bitmask import validate_pc, mask_from_pcs
-from ..core.enharmonics import name_for_pc  # <— use centralized policy
+from ..core.bitmask import validate_pc, mask_from_pcs, rotate_mask
+from ..core.enharmonics import pc_names  # <— use centralized policy
+from ..core.tables import DEGREE_LABELS
+from ._ansi import _RESET, _prefix, stdout_is_tty
 
 DegreeStyle = Literal["names", "degrees"]
 SpellingPref = Literal["auto", "sharps", "flats"]
@@ -14,49 +19,9 @@ LayoutMode = Literal["chromatic", "in_scale"]
 AnchorMode = Literal["fixed_C", "fixed_root"]
 Origin = Literal["upper", "lower"]  # NEW
 
-_BASE_DEGREE = {
-    0: "1", 1: "b2", 2: "2", 3: "b3", 4: "3",
-    5: "4", 6: "#4", 7: "5", 8: "b6", 9: "6",
-    10: "b7", 11: "7",
-}
-
-_ANSI = {
-    "reset": "\x1b[0m",
-    "bold": "\x1b[1m",
-    "dim": "\x1b[2m",
-    "fg_black": "\x1b[30m",
-    "fg_red": "\x1b[31m",
-    "fg_green": "\x1b[32m",
-    "fg_yellow": "\x1b[33m",
-    "fg_blue": "\x1b[34m",
-    "fg_magenta": "\x1b[35m",
-    "fg_cyan": "\x1b[36m",
-    "fg_white": "\x1b[37m",
-    "fg_bright_black": "\x1b[90m",
-    "fg_bright_red": "\x1b[91m",
-    "fg_bright_green": "\x1b[92m",
-    "fg_bright_yellow": "\x1b[93m",
-    "fg_bright_blue": "\x1b[94m",
-    "fg_bright_magenta": "\x1b[95m",
-    "fg_bright_cyan": "\x1b[96m",
-    "fg_bright_white": "\x1b[97m",
-}
-
-def _paint(s: str, *, fg: str | None = None, bold: bool = False, dim: bool = False) -> str:
-    parts = []
-    if bold:
-        parts.append(_ANSI["bold"])
-    if dim:
-        parts.append(_ANSI["dim"])
-    if fg:
-        parts.append(_ANSI[fg])
-    if not parts:
-        return s
-    return "".join(parts) + s + _ANSI["reset"]
-
 def _degree_for_pc(pc: int, tonic_pc: int) -> str:
     rel = (pc - (tonic_pc % 12)) % 12
-    return _BASE_DEGREE[rel]
+    return DEGREE_LABELS[rel]
 
 def _pad2_names(s: str) -> str:
     """Pad to 2 chars for NAME labels only (C -> 'C_'), but NOT for degrees."""
@@ -66,10 +31,26 @@ def _pad_degree(token: str) -> str:
     """Pad single-character degree labels so grid columns stay aligned."""
     return token if len(token) >= 2 else f"_{token}"
 
+@lru_cache(maxsize=256)
+def _pad_labels(
+    degree_style: DegreeStyle, spelling: SpellingPref, key_signature: int | None, tonic_pc: int
+) -> tuple[str, ...]:
+    """Padded pad label of every pc, indexed by pc, for one display setting.
+
+    A grid has 64 pads but only 12 pcs, and the setting only changes on
+    user toggles, so the labels are resolved once per setting.
+    """
+    if degree_style == "degrees":
+        return tuple(_pad_degree(_degree_for_pc(pc, tonic_pc)) for pc in range(12))
+    return tuple(_pad2_names(name) for name in pc_names(spelling, key_signature))
+
+# Semitones between vertically adjacent pads, per preset.
+_ROW_OFFSETS: dict[str, int] = {"fourths": 5, "thirds": 4, "sequential": 1}
+
 def _row_offset_for(preset: LayoutPreset) -> int:
-    return {"fourths": 5, "thirds": 4, "sequential": 1}[preset]
+    return _ROW_OFFSETS[preset]
 
-@dataclass
+@dataclass(slots=True)
 class PushCell:
     row: int
     col: int
@@ -93,31 +74,103 @@ class PushCell:
         validate_pc(self.tonic_pc)
         rel = (self.pc - self.tonic_pc) % 12
         self.in_key = (self.scale_degrees_rel is None) or (rel in self.scale_degrees_rel)
-        self.is_tonic = (self.pc % 12) == (self.tonic_pc % 12)
-        self.in_chord = bool(self.chord_pcs_abs) and ((self.pc % 12) in self.chord_pcs_abs)
+        # pc and tonic_pc are validated 0..11 above, so no further wrapping.
+        self.is_tonic = self.pc == self.tonic_pc
+        self.in_chord = bool(self.chord_pcs_abs) and (self.pc in self.chord_pcs_abs)
 
     def render(self) -> str:
         # For 'in_scale + hide_out_of_key', we now ELIDE out-of-key pads upstream (grid level).
         # So rendering here retains fixed width for every token.
         # Label (no dash for degree-style)
-        if self.degree_style == "degrees":
-            token = _pad_degree(_degree_for_pc(self.pc, self.tonic_pc))
-        else:
-            token = _pad2_names(name_for_pc(self.pc, prefer=self.spelling, key_signature=self.key_signature))
+        token = _pad_labels(self.degree_style, self.spelling, self.key_signature, self.tonic_pc)[self.pc]
 
         # inner brackets: tonic { }, in-key ( ), out-of-key [ ]
         if self.is_tonic:
-            inner = "{%s}" % token
+            opener, closer = "[{", "}"
+        elif self.in_key:
+            opener, closer = "[(", ")"
         else:
-            inner = f"({token})" if self.in_key else f"[{token}]"
-
-        # external mark: * if in chord else -
-        mark = "*" if self.in_chord else "-"
-        return f"[{inner}{mark}]"
+            opener, closer = "[[", "]"
+
+        # external mark: * if in chord else -; concatenated straight onto the
+        # brackets instead of formatting an intermediate inner token.
+        return opener + token + closer + ("*]" if self.in_chord else "-]")
+
+
+# Pad states as small ints, in priority order (highest first).
+(
+    _TONIC_ROOT,     # tonic + chord root
+    _TONIC_CHORD,    # tonic also in chord
+    _TONIC,          # tonic not in chord
+    _ROOT_OOK,       # chord root out of key
+    _ROOT,           # chord root in key
+    _CHORD_OOK,      # chord tone out of key
+    _CHORD,          # chord tone in key
+    _IN_KEY,         # in-key non-chord
+    _OOK,            # out-of-key non-chord
+) = range(9)
+
+# ANSI prefix of each pad state, indexed by state and joined once at import;
+# a styled pad is then prefix + token + reset with no per-pad style lookup.
+_STATE_PREFIX: tuple[str, ...] = (
+    _prefix("fg_bright_magenta", True, False),
+    _prefix("fg_bright_cyan", True, False),
+    _prefix("fg_cyan", True, False),
+    _prefix("fg_bright_red", True, False),
+    _prefix("fg_bright_yellow", True, False),
+    _prefix("fg_red", True, False),
+    _prefix("fg_yellow", True, False),
+    _prefix("fg_white", False, False),
+    _prefix("fg_bright_black", False, True),
+)
+
+
+def _state_for(is_tonic: bool, is_chord: bool, is_in_key: bool, is_chord_root: bool) -> int:
+    """The priority rules: first matching state in ``_TONIC_ROOT`` .. ``_OOK`` order."""
+    if is_chord_root and is_tonic:
+        return _TONIC_ROOT
+    if is_chord and is_tonic:
+        return _TONIC_CHORD
+    if is_tonic:
+        return _TONIC
+    if is_chord_root and not is_in_key:
+        return _ROOT_OOK
+    if is_chord_root:
+        return _ROOT
+    if is_chord and not is_in_key:
+        return _CHORD_OOK
+    if is_chord:
+        return _CHORD
+    if is_in_key:
+        return _IN_KEY
+    return _OOK
+
+
+# _state_for over all 16 flag combinations, indexed by
+# is_tonic << 3 | in_chord << 2 | in_key << 1 | is_chord_root.
+_STATE_BY_FLAGS: tuple[int, ...] = tuple(
+    _state_for(bool(bits & 8), bool(bits & 4), bool(bits & 2), bool(bits & 1))
+    for bits in range(16)
+)
+
+
+def _cell_state(cell: PushCell, chord_root_pc: int | None) -> int:
+    """The pad's state code (an index into ``_STATE_PREFIX``), shared by the
+    text and block renderings.
+
+    ``chord_root_pc`` is 0..11 or None, so it compares to the (validated) pad
+    pc directly.
+    """
+    return _STATE_BY_FLAGS[
+        cell.is_tonic << 3 | cell.in_chord << 2 | cell.in_key << 1 | (cell.pc == chord_root_pc)
+    ]
 
 
 # ---------- Grid object ----------
 
+# PushGrid fields holding a mode string compared against literals.
+_MODE_FIELDS = ("preset", "anchor", "origin", "layout_mode", "degree_style", "spelling")
+
 @dataclass
 class PushGrid:
     # layout & anchoring
@@ -148,11 +201,42 @@ class PushGrid:
 
     # internal
     cells: list[list[PushCell]] = field(init=False)
+    # Inputs of the last rebuild(); a toggle that changes none of them keeps
+    # the existing cells.
+    _built_from: tuple | None = field(default=None, init=False, repr=False, compare=False)
+    # batch_updates() nesting depth, and whether a rebuild was deferred.
+    _batch_depth: int = field(default=0, init=False, repr=False, compare=False)
+    _rebuild_pending: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
+        self._intern_modes()
         self.rebuild()
 
+    def _intern_modes(self) -> None:
+        # Mode strings arrive from argv or a DisplayContext as fresh objects;
+        # interned, the per-row/per-pad comparisons against literals resolve
+        # on identity.
+        for name in _MODE_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
+
     # Public toggles (unchanged signatures + a couple new)
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """Defer the setters' rebuilds to a single one when the block exits.
+
+        Reentrant; ``cells`` is stale until the outermost block ends.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._rebuild_pending:
+                self._rebuild_pending = False
+                self.rebuild()
+
     def set_key(self, tonic_pc: int, scale_degrees_rel: list[int] | None) -> None:
         self.tonic_pc = tonic_pc % 12
         self.scale_degrees_rel = None if scale_degrees_rel is None else [d % 12 for d in scale_degrees_rel]
@@ -165,16 +249,19 @@ class PushGrid:
 
     def set_preset(self, preset: LayoutPreset) -> None:
         self.preset = preset
+        self._intern_modes()
         self.rebuild()
 
     def set_anchor(self, anchor: AnchorMode, root_pc: int | None = None) -> None:
         self.anchor = anchor
         if root_pc is not None:
             self.root_pc = root_pc % 12
+        self._intern_modes()
         self.rebuild()
 
     def set_origin(self, origin: Origin) -> None:
         self.origin = origin
+        self._intern_modes()
         self.rebuild()
 
     def set_key_signature(self, sig: int | None) -> None:
@@ -188,10 +275,17 @@ class PushGrid:
         degree_style: DegreeStyle | None = None,
         spelling: SpellingPref | None = None,
     ) -> None:
-        if layout_mode: self.layout_mode = layout_mode
-        if hide_out_of_key is not None: self.hide_out_of_key = hide_out_of_key
-        if degree_style: self.degree_style = degree_style
-        if spelling: self.spelling = spelling
+        current = (self.layout_mode, self.hide_out_of_key, self.degree_style, self.spelling)
+        updated = (
+            layout_mode or self.layout_mode,
+            self.hide_out_of_key if hide_out_of_key is None else hide_out_of_key,
+            degree_style or self.degree_style,
+            spelling or self.spelling,
+        )
+        if updated == current:
+            return  # e.g. a UI re-selecting the option already in effect
+        self.layout_mode, self.hide_out_of_key, self.degree_style, self.spelling = updated
+        self._intern_modes()
         self.rebuild()
 
     def render_lines(self) -> list[str]:
@@ -204,112 +298,65 @@ class PushGrid:
         Priority: tonic > in-chord > in-scale > out-of-scale.
         Color activation is controlled by self.color_mode: auto/always/never.
         """
-        import sys
         want_color = getattr(self, "color_mode", "auto")
         if want_color == "never":
             do_color = False
         elif want_color == "always":
             do_color = True
         else:  # auto
-            do_color = sys.stdout.isatty()
+            do_color = stdout_is_tty()
 
+        # Every pad with the same pc and flags renders identically, and an 8x8
+        # grid shows at most 12 pcs, so each styled token is built once per call.
+        styled: dict[tuple[int, bool, bool, bool], str] = {}
+        chord_root = None if self.chord_root_pc is None else self.chord_root_pc % 12
         lines: list[str] = []
         for row in self.cells:
             tokens: list[str] = []
             for cell in row:
-                tok = cell.render()  # raw token with brackets/mark
-
-                if not do_color:
-                    tokens.append(tok)
-                    continue
-
-                # Decide style by priority (highest → lowest):
-                # tonic in chord > tonic (not in chord) > chord root (in key) > chord root (out of key)
-                # > chord tone (in/out) > in-key non-chord > out-of-key non-chord
-                is_chord = cell.in_chord
-                is_tonic = cell.is_tonic
-                is_in_key = cell.in_key
-                is_chord_root = (self.chord_root_pc is not None) and ((cell.pc % 12) == self.chord_root_pc)
-
-                if is_chord_root and is_tonic:
-                    colored = _paint(tok, fg="fg_bright_magenta", bold=True)
-                elif is_chord and is_tonic:
-                    colored = _paint(tok, fg="fg_bright_cyan", bold=True)                  # tonic also in chord
-                elif is_tonic:
-                    colored = _paint(tok, fg="fg_cyan", bold=True)                         # tonic not in chord
-                elif is_chord_root and not is_in_key:
-                    colored = _paint(tok, fg="fg_bright_red", bold=True)                   # chord root out of key
-                elif is_chord_root:
-                    colored = _paint(tok, fg="fg_bright_yellow", bold=True)                # chord root in key
-                elif is_chord and not is_in_key:
-                    colored = _paint(tok, fg="fg_red", bold=True)                          # chord tone out of key
-                elif is_chord and is_in_key:
-                    colored = _paint(tok, fg="fg_yellow", bold=True)                       # chord tone in key
-                elif is_in_key:
-                    colored = _paint(tok, fg="fg_white")                                   # in-key non-chord
-                else:
-                    colored = _paint(tok, fg="fg_bright_black", dim=True)                  # out-of-key non-chord
-
-                tokens.append(colored)
-
-          
+                key = (cell.pc, cell.in_key, cell.in_chord, cell.is_tonic)
+                tok = styled.get(key)
+                if tok is None:
+                    tok = cell.render()  # raw token with brackets/mark
+                    if do_color:
+                        tok = _STATE_PREFIX[_cell_state(cell, chord_root)] + tok + _RESET
+                    styled[key] = tok
+                tokens.append(tok)
             lines.append(" ".join(tokens))
         return lines
-    
+
     def render_block_lines(self, char: str = "■") -> list[str]:
         """
         Return lines of colored blocks (e.g., '■') mirroring the text grid.
         Uses the same color priority as render_lines(), but prints a single glyph per pad.
         """
-        import sys
         want_color = getattr(self, "color_mode", "auto")
         if want_color == "never":
             do_color = False
         elif want_color == "always":
             do_color = True
         else:
-            do_color = sys.stdout.isatty()
+            do_color = stdout_is_tty()
 
+        if not do_color:
+            return ["  ".join(char for _ in row) for row in self.cells]
+
+        styled: dict[tuple[int, bool, bool, bool], str] = {}
+        chord_root = None if self.chord_root_pc is None else self.chord_root_pc % 12
         lines: list[str] = []
         for row in self.cells:
             tokens: list[str] = []
             for cell in row:
-                glyph = char
-
-                if not do_color:
-                    tokens.append(glyph)
-                    continue
-
-                # EXACTLY the same priority you finalized for the text grid:
-                is_chord = cell.in_chord
-                is_tonic = cell.is_tonic
-                is_in_key = cell.in_key
-                is_chord_root = (self.chord_root_pc is not None) and ((cell.pc % 12) == self.chord_root_pc)
-
-                if is_tonic and is_chord_root:
-                    colored = _paint(glyph, fg="fg_bright_magenta", bold=True)  # tonic + chord root
-                elif is_chord and is_tonic:
-                    colored = _paint(glyph, fg="fg_bright_cyan", bold=True)     # tonic in chord (not root)
-                elif is_tonic:
-                    colored = _paint(glyph, fg="fg_cyan", bold=True)            # tonic only
-                elif is_chord_root and not is_in_key:
-                    colored = _paint(glyph, fg="fg_bright_red", bold=True)      # chord root OOK
-                elif is_chord_root:
-                    colored = _paint(glyph, fg="fg_bright_yellow", bold=True)   # chord root in key
-                elif is_chord and not is_in_key:
-                    colored = _paint(glyph, fg="fg_red", bold=True)             # chord tone OOK
-                elif is_chord and is_in_key:
-                    colored = _paint(glyph, fg="fg_yellow", bold=True)          # chord tone in key
-                elif is_in_key:
-                    colored = _paint(glyph, fg="fg_white")                      # in key (non-chord)
-                else:
-                    colored = _paint(glyph, fg="fg_bright_black", dim=True)     # out of key (non-chord)
-
-                tokens.append(colored)
+                key = (cell.pc, cell.in_key, cell.in_chord, cell.is_tonic)
+                glyph = styled.get(key)
+                if glyph is None:
+                    prefix = _STATE_PREFIX[_cell_state(cell, chord_root)]
+                    glyph = styled[key] = prefix + char + _RESET
+                tokens.append(glyph)
             # two spaces between blocks keeps it readable in most terminals
             lines.append("  ".join(tokens))
         return lines
-    
+
 
     # ---- internal helpers for row construction ----
 
@@ -325,19 +372,22 @@ class PushGrid:
         # isomorphic rows: right = +1 semitone; up = +row_offset semitones
         return (anchor_pc + col + row * _row_offset_for(self.preset)) % 12
 
-    def _build_row_pcs(self, row: int, anchor_pc: int) -> list[int]:
-        """Return the 8 PCs for a row, honoring in-scale elision when requested."""
+    def _build_row_pcs(self, row: int, anchor_pc: int, key_mask: int | None = None) -> list[int]:
+        """Return the 8 PCs for a row, eliding pcs outside *key_mask* (absolute
+        in-key pcs as a 12-bit mask) when one is given."""
         # seed more than 8 so we can elide out-of-scale and still fill 8
         # 8 cols + up to 12 extras to find enough in-scale notes
-        base = [self._pc_at(row, c, anchor_pc) for c in range(8)]
-        if self.scale_degrees_rel is not None and (self.layout_mode == "in_scale" or self.hide_out_of_key):
-            relset = set(self.scale_degrees_rel)
-            filtered: list[int] = [p for p in base if ((p - self.tonic_pc) % 12) in relset]
+        # Every preset steps +1 semitone per column, so only the row's first
+        # pad needs the layout math; the rest count up from it.
+        row_start = self._pc_at(row, 0, anchor_pc)
+        base = [(row_start + c) % 12 for c in range(8)]
+        if key_mask is not None:
+            filtered: list[int] = [p for p in base if key_mask >> p & 1]
             c = 8
             while len(filtered) < 8 and c < 8 + 24:
-                candidate = self._pc_at(row, c, anchor_pc)
+                candidate = (row_start + c) % 12
                 base.append(candidate)
-                if ((candidate - self.tonic_pc) % 12) in relset:
+                if key_mask >> candidate & 1:
                     filtered.append(candidate)
                 c += 1
             if filtered:
@@ -346,32 +396,60 @@ class PushGrid:
 
     # ---- build & render ----
     def rebuild(self) -> None:
+        if self._batch_depth:
+            self._rebuild_pending = True
+            return
+        built_from = (
+            self.preset, self.anchor, self.root_pc, self.origin, self.tonic_pc,
+            None if self.scale_degrees_rel is None else tuple(self.scale_degrees_rel),
+            None if self.chord_pcs_abs is None else tuple(self.chord_pcs_abs),
+            self.layout_mode, self.hide_out_of_key, self.degree_style,
+            self.spelling, self.key_signature,
+        )
+        if built_from == self._built_from:
+            return
+        self._built_from = built_from
+
         anchor_pc = 0 if self.anchor == "fixed_C" else self.root_pc
         # Build row-wise pcs first (so we can elide non-scale pads)
-        rows = list(range(8))
-        if self.origin == "lower":
-            rows = list(reversed(rows))  # bottom-first visual order
+        rows = range(7, -1, -1) if self.origin == "lower" else range(8)  # lower: bottom-first visual order
 
         rel_set = None if self.scale_degrees_rel is None else set(self.scale_degrees_rel)
         chord_set = None if self.chord_pcs_abs is None else set(self.chord_pcs_abs)
-
-        self.cells = []
-        for ridx, r in enumerate(rows):
-            pcs_row = self._build_row_pcs(r, anchor_pc)
-            line: list[PushCell] = []
-            for c, pc in enumerate(pcs_row):
-                line.append(PushCell(
+        # In-scale elision tests each candidate pad against one absolute key
+        # mask, derived once per rebuild rather than once per row.
+        elide_mask = None
+        if rel_set is not None and (self.layout_mode == "in_scale" or self.hide_out_of_key):
+            elide_mask = rotate_mask(sum(1 << d for d in rel_set if 0 <= d < 12), self.tonic_pc)
+
+        # Grid-wide settings read once, not once per pad.
+        tonic_pc = self.tonic_pc
+        degree_style = self.degree_style
+        spelling = self.spelling
+        key_signature = self.key_signature
+        layout_mode = self.layout_mode
+        hide_out_of_key = self.hide_out_of_key
+
+        # Rows may come back short after in-scale elision, so cells stay a
+        # list of rows (the renderers join each row as one line) rather than
+        # a flat 64-slot list.
+        self.cells = [
+            [
+                PushCell(
                     row=ridx, col=c, pc=pc,
-                    tonic_pc=self.tonic_pc,
+                    tonic_pc=tonic_pc,
                     scale_degrees_rel=rel_set,
                     chord_pcs_abs=chord_set,
-                    degree_style=self.degree_style,
-                    spelling=self.spelling,
-                    key_signature=self.key_signature,
-                    layout_mode=self.layout_mode,
-                    hide_out_of_key=self.hide_out_of_key,
-                ))
-            self.cells.append(line)
+                    degree_style=degree_style,
+                    spelling=spelling,
+                    key_signature=key_signature,
+                    layout_mode=layout_mode,
+                    hide_out_of_key=hide_out_of_key,
+                )
+                for c, pc in enumerate(self._build_row_pcs(r, anchor_pc, elide_mask))
+            ]
+            for ridx, r in enumerate(rows)
+        ]
 
 
     # convenience: compute chord/scale masks if needed elsewhere
@@ -2,41 +2,115 @@
 
 from __future__ import annotations
 
+from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+from weakref import WeakMethod
 
 
 @dataclass
 class DisplayLayer:
-    """Single layer of display preferences (e.g., defaults, session, view)."""
+    """Single layer of display preferences (e.g., defaults, session, view).
+
+    ``settings`` is a read-only view: every write goes through ``set()`` so
+    contexts holding the layer see it. A ``frozen`` layer also refuses
+    ``set()``, so one instance can be shared by any number of contexts.
+    """
 
     name: str
-    settings: Dict[str, Any] = field(default_factory=dict)
+    settings: Mapping[str, Any] = field(default_factory=dict)
+    frozen: bool = False
+    _data: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    # Contexts holding this layer, told to drop their resolved view on set().
+    # Weak, so a layer outliving a context doesn't keep it alive.
+    _watchers: list[WeakMethod] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._data = dict(self.settings)
+        self.settings = MappingProxyType(self._data)
 
     def get(self, key: str, default: Any = None) -> Any:
-        return self.settings.get(key, default)
+        return self._data.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
-        self.settings[key] = value
+        if self.frozen:
+            raise TypeError(f"Display layer {self.name!r} is frozen")
+        self._data[key] = value
+        dead = False
+        for ref in self._watchers:
+            invalidate = ref()
+            if invalidate is None:
+                dead = True
+            else:
+                invalidate()
+        if dead:
+            self._watchers[:] = [ref for ref in self._watchers if ref() is not None]
+
+    # The read-only proxy and the weak watcher hooks can't be pickled, so only
+    # the plain fields travel; contexts re-attach themselves on restore.
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"name": self.name, "settings": dict(self._data), "frozen": self.frozen}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.name = state["name"]
+        self.frozen = state["frozen"]
+        self._data = dict(state["settings"])
+        self.settings = MappingProxyType(self._data)
+        self._watchers = []
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "DisplayLayer":
+        if self.frozen:
+            return self  # immutable, so sharing is a faithful copy
+        clone = DisplayLayer.__new__(DisplayLayer)
+        memo[id(self)] = clone
+        clone.__setstate__(deepcopy(self.__getstate__(), memo))
+        return clone
+
+
+# Shared by every DisplayContext; a set() aimed at it thaws a private copy.
+_DEFAULT_LAYER = DisplayLayer(
+    name="defaults",
+    settings={
+        "spelling": "auto",
+        "label_mode": "names",
+        "layout_mode": "chromatic",
+        "hide_out_of_key": False,
+    },
+    frozen=True,
+)
 
 
 class DisplayContext:
     """Stacked display preferences resolved from multiple layers."""
 
     def __init__(self) -> None:
-        self._layers: list[DisplayLayer] = [DisplayLayer(name="defaults", settings={
-            "spelling": "auto",
-            "label_mode": "names",
-            "layout_mode": "chromatic",
-            "hide_out_of_key": False,
-        })]
-        self._listeners: list[callable[[str, Any], None]] = []
+        self._layers: list[DisplayLayer] = [_DEFAULT_LAYER]
+        # Lowest layer per name — the one set(layer=name) writes to — so the
+        # write path skips the stack scan. Kept in step by every mutation.
+        self._by_name: Dict[str, DisplayLayer] = {_DEFAULT_LAYER.name: _DEFAULT_LAYER}
+        # (callback, watched keys or None) pairs. Rebuilt on add/remove, so
+        # _notify iterates it as-is: a listener that (un)subscribes
+        # mid-dispatch swaps in a new tuple, not this one.
+        self._listeners: tuple[tuple[Callable[[str, Any], None], frozenset[str] | None], ...] = ()
+        # Flattened top-most-wins view of every layer; rebuilt lazily on the
+        # first get() after any layer change, so reads are one dict lookup.
+        self._resolved: Dict[str, Any] | None = None
+        # Bumped whenever the resolved view may have changed; lets callers
+        # cache anything derived from get() (see formatters.label_resolver).
+        self._version = 0
+        self._attach(self._layers[0])
 
     # Layer management --------------------------------------------------
 
     def push_layer(self, layer: DisplayLayer) -> None:
+        self._attach(layer)
         self._layers.append(layer)
-        self._notify("layer_added", layer.name)
+        self._by_name.setdefault(layer.name, layer)
+        if self._listeners:
+            self._notify("layer_added", layer.name)
 
     def pop_layer(self, *, name: Optional[str] = None) -> DisplayLayer:
         if len(self._layers) == 1:
@@ -50,52 +124,122 @@ class DisplayContext:
                     break
             else:
                 raise KeyError(f"Layer {name!r} not found")
-        self._notify("layer_removed", layer.name)
+        self._detach(layer)
+        if self._by_name.get(layer.name) is layer:
+            self._reindex()
+        if self._listeners:
+            self._notify("layer_removed", layer.name)
         return layer
 
     # Settings ---------------------------------------------------------
 
     def get(self, key: str, default: Any = None) -> Any:
-        for layer in reversed(self._layers):
-            if key in layer.settings:
-                return layer.settings[key]
-        return default
+        resolved = self._resolved
+        if resolved is None:
+            resolved = {}
+            for layer in self._layers:
+                resolved.update(layer.settings)
+            self._resolved = resolved
+        return resolved.get(key, default)
 
     def set(self, key: str, value: Any, *, layer: str = "session") -> None:
         target = self._ensure_layer(layer)
         target.set(key, value)
-        self._notify("setting_changed", {"key": key, "value": value, "layer": layer})
+        # Guarded here, not in _notify, so the payload dict is never built
+        # for a context nobody is watching (the usual case).
+        if self._listeners:
+            self._notify("setting_changed", {"key": key, "value": value, "layer": layer})
 
     def _ensure_layer(self, name: str) -> DisplayLayer:
-        for layer in self._layers:
-            if layer.name == name:
-                return layer
-        new_layer = DisplayLayer(name=name)
-        self._layers.append(new_layer)
-        return new_layer
+        layer = self._by_name.get(name)
+        if layer is None:
+            layer = DisplayLayer(name=name)
+            self._attach(layer)
+            self._layers.append(layer)
+            self._by_name[name] = layer
+        elif layer.frozen:
+            # Copy-on-write: this context gets its own mutable copy.
+            thawed = DisplayLayer(name=layer.name, settings=dict(layer.settings))
+            idx = next(i for i, held in enumerate(self._layers) if held is layer)
+            self._detach(layer)
+            self._attach(thawed)
+            self._layers[idx] = thawed
+            self._by_name[name] = layer = thawed
+        return layer
 
-    # Observation ------------------------------------------------------
+    def _reindex(self) -> None:
+        self._by_name = {}
+        for layer in self._layers:
+            self._by_name.setdefault(layer.name, layer)
 
-    def add_listener(self, callback: callable[[str, Any], None]) -> None:
-        if callback not in self._listeners:
-            self._listeners.append(callback)
+    def _attach(self, layer: DisplayLayer) -> None:
+        # Frozen layers never change, so they need no hook (and a shared one
+        # must not accumulate a hook per context).
+        if not layer.frozen:
+            layer._watchers.append(WeakMethod(self._invalidate))
+        self._invalidate()
 
-    def remove_listener(self, callback: callable[[str, Any], None]) -> None:
+    def _detach(self, layer: DisplayLayer) -> None:
         try:
-            self._listeners.remove(callback)
+            layer._watchers.remove(WeakMethod(self._invalidate))
         except ValueError:
             pass
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._resolved = None
+        self._version += 1
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # Restored layers come back without watchers (see DisplayLayer).
+        self.__dict__.update(state)
+        for layer in self._layers:
+            if not layer.frozen:
+                layer._watchers.append(WeakMethod(self._invalidate))
+        self._invalidate()
+
+    @property
+    def version(self) -> int:
+        """Changes whenever any resolved setting may have changed."""
+        return self._version
+
+    # Observation ------------------------------------------------------
+
+    def add_listener(
+        self, callback: Callable[[str, Any], None], *, keys: Iterable[str] | None = None
+    ) -> None:
+        """Call ``callback(event, payload)`` on every change.
+
+        With ``keys``, ``setting_changed`` events for other settings are not
+        delivered; layer added/removed events always are.
+        """
+        if all(cb != callback for cb, _ in self._listeners):
+            watched = None if keys is None else frozenset(keys)
+            self._listeners = self._listeners + ((callback, watched),)
+
+    def remove_listener(self, callback: Callable[[str, Any], None]) -> None:
+        if any(cb == callback for cb, _ in self._listeners):
+            self._listeners = tuple(entry for entry in self._listeners if entry[0] != callback)
 
     def _notify(self, event: str, payload: Any) -> None:
-        for listener in list(self._listeners):
-            listener(event, payload)
+        key = payload["key"] if event == "setting_changed" else None
+        for listener, watched in self._listeners:
+            if watched is None or key is None or key in watched:
+                listener(event, payload)
 
     # Serialization ----------------------------------------------------
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, *, copy: bool = True) -> Dict[str, Any]:
+        """Serializable snapshot of the layer stack.
+
+        ``copy=False`` hands out read-only views of the live settings instead
+        of per-layer copies, for callers that walk the result straight away as
+        plain mappings. The views track later changes; ``json.dumps`` needs
+        ``default=dict`` to encode them.
+        """
         return {
             "layers": [
-                {"name": layer.name, "settings": dict(layer.settings)}
+                {"name": layer.name, "settings": dict(layer.settings) if copy else layer.settings}
                 for layer in self._layers
             ]
         }
@@ -103,13 +247,18 @@ class DisplayContext:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DisplayContext":
         ctx = cls()
+        for layer in ctx._layers:
+            ctx._detach(layer)
         ctx._layers.clear()
         for layer_data in data.get("layers", []):
-            ctx._layers.append(
-                DisplayLayer(name=layer_data.get("name", "layer"), settings=layer_data.get("settings", {}))
-            )
+            layer = DisplayLayer(name=layer_data.get("name", "layer"), settings=layer_data.get("settings", {}))
+            ctx._attach(layer)
+            ctx._layers.append(layer)
         if not ctx._layers:
-            ctx._layers.append(DisplayLayer(name="defaults"))
+            layer = DisplayLayer(name="defaults")
+            ctx._attach(layer)
+            ctx._layers.append(layer)
+        ctx._reindex()
         return ctx
 
 
@@ -2,106 +2,148 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Optional
-
-from ..core.enharmonics import name_for_pc
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional, Sequence
+from weakref import WeakKeyDictionary
+
+from ..core.enharmonics import pc_names
+from ..core.tables import DEGREE_LABELS as _DEGREE_LABELS
+from ..core.tables import INTERVAL_LABELS as _INTERVAL_LABELS
+from ..core.tables import KEY_SIGNATURE_BY_TONIC as _KEY_SIGNATURE_BY_TONIC
 from .context import DisplayContext
 
-_KEY_SIGNATURE_BY_TONIC = {
-    0: 0,
-    7: 1,
-    2: 2,
-    9: 3,
-    4: 4,
-    11: 5,
-    6: 6,
-    5: -1,
-    10: -2,
-    3: -3,
-    8: -4,
-    1: -5,
-}
-
-_DEGREE_LABELS = {
-    0: "1",
-    1: "b2",
-    2: "2",
-    3: "b3",
-    4: "3",
-    5: "4",
-    6: "#4",
-    7: "5",
-    8: "b6",
-    9: "6",
-    10: "b7",
-    11: "7",
-}
-
-_INTERVAL_LABELS = {
-    0: "P1",
-    1: "m2",
-    2: "M2",
-    3: "m3",
-    4: "M3",
-    5: "P4",
-    6: "TT",
-    7: "P5",
-    8: "m6",
-    9: "M6",
-    10: "m7",
-    11: "M7",
-}
+_SEMITONE_LABELS = tuple(str(rel) for rel in range(12))
 
 
 def key_signature_for_tonic(tonic_pc: Optional[int]) -> Optional[int]:
     if tonic_pc is None:
         return None
-    return _KEY_SIGNATURE_BY_TONIC.get(tonic_pc % 12)
+    return _KEY_SIGNATURE_BY_TONIC[tonic_pc % 12]
 
 
-def format_pitch_class(pc: int, context: DisplayContext) -> str:
+# Per-mode label tables: each reads its context fallbacks once and returns
+# ``(labels, base)`` such that a pc's label is ``labels[(pc - base) % 12]``.
+# The single-pc ``format_*`` helpers and the batch ``format_pcs`` share them.
+
+def _name_table(context: DisplayContext) -> tuple[tuple[str, ...], int]:
     spelling = context.get("spelling", "auto")
     key_sig = context.get("key_signature")
     tonic = context.get("tonic_pc")
     if key_sig is None and spelling == "auto" and tonic is not None:
         key_sig = key_signature_for_tonic(tonic)
-    return name_for_pc(pc, prefer=spelling, key_signature=key_sig)
+    return pc_names(spelling, key_sig), 0
 
 
-def format_degree(pc: int, context: DisplayContext) -> str:
+def _degree_table(context: DisplayContext) -> tuple[tuple[str, ...], int]:
     tonic = context.get("tonic_pc")
-    if tonic is None:
-        tonic = 0
-    rel = (pc - tonic) % 12
-    return _DEGREE_LABELS.get(rel, f"pc{rel}")
+    return _DEGREE_LABELS, 0 if tonic is None else tonic
 
 
-def format_interval(pc: int, context: DisplayContext) -> str:
+def _interval_table(context: DisplayContext) -> tuple[tuple[str, ...], int]:
     root = context.get("chord_root_pc")
     if root is None:
         root = context.get("tonic_pc") or 0
-    rel = (pc - root) % 12
-    return _INTERVAL_LABELS.get(rel, str(rel))
+    return _INTERVAL_LABELS, root
 
 
-def format_semitone(pc: int, context: DisplayContext) -> str:
+def _semitone_table(context: DisplayContext) -> tuple[tuple[str, ...], int]:
     base = context.get("tonic_pc")
     if base is None:
         base = context.get("chord_root_pc")
-    if base is None:
-        base = 0
-    return str((pc - base) % 12)
+    return _SEMITONE_LABELS, 0 if base is None else base
 
 
-def resolve_label(pc: int, context: DisplayContext, *, mode: Optional[str] = None) -> str:
+# Label mode -> table; anything else labels by note name.
+_LABEL_TABLES = {
+    "degrees": _degree_table,
+    "intervals": _interval_table,
+    "semitones": _semitone_table,
+}
+
+
+def _label_table(context: DisplayContext, mode: Optional[str]) -> tuple[tuple[str, ...], int]:
     actual_mode = mode or context.get("label_mode", "names")
-    if actual_mode == "degrees":
-        return format_degree(pc, context)
-    if actual_mode == "intervals":
-        return format_interval(pc, context)
-    if actual_mode == "semitones":
-        return format_semitone(pc, context)
-    return format_pitch_class(pc, context)
+    return _LABEL_TABLES.get(actual_mode, _name_table)(context)
+
+
+@dataclass(frozen=True, slots=True)
+class LabelResolver:
+    """Every label table of one context state, resolved up front.
+
+    Build one per render (or take :func:`label_resolver`'s cached one) and
+    label any number of pcs with no further context reads or fallback chains.
+    """
+
+    version: int
+    label_mode: str
+    tables: Mapping[str, tuple[tuple[str, ...], int]]
+
+    @classmethod
+    def from_context(cls, context: DisplayContext) -> "LabelResolver":
+        tables = {mode: build(context) for mode, build in _LABEL_TABLES.items()}
+        tables["names"] = _name_table(context)
+        return cls(
+            version=context.version,
+            label_mode=context.get("label_mode", "names"),
+            tables=MappingProxyType(tables),
+        )
+
+    def _table(self, mode: Optional[str]) -> tuple[tuple[str, ...], int]:
+        tables = self.tables
+        return tables.get(mode or self.label_mode) or tables["names"]
+
+    def label(self, pc: int, *, mode: Optional[str] = None) -> str:
+        labels, base = self._table(mode)
+        return labels[(pc - base) % 12]
+
+    def labels(self, pcs: Iterable[int], *, mode: Optional[str] = None) -> list[str]:
+        labels, base = self._table(mode)
+        return [labels[(pc - base) % 12] for pc in pcs]
+
+
+# One resolver per live context, rebuilt only when its version moves. Weakly
+# keyed, so a dropped context takes its resolver with it.
+_RESOLVERS: "WeakKeyDictionary[DisplayContext, LabelResolver]" = WeakKeyDictionary()
+
+
+def label_resolver(context: DisplayContext) -> LabelResolver:
+    """The context's :class:`LabelResolver`, cached until its settings change."""
+    resolver = _RESOLVERS.get(context)
+    if resolver is None or resolver.version != context.version:
+        resolver = _RESOLVERS[context] = LabelResolver.from_context(context)
+    return resolver
+
+
+def format_pitch_class(pc: int, context: DisplayContext) -> str:
+    labels, _ = _name_table(context)
+    return labels[pc % 12]
+
+
+def format_degree(pc: int, context: DisplayContext) -> str:
+    labels, tonic = _degree_table(context)
+    return labels[(pc - tonic) % 12]
+
+
+def format_interval(pc: int, context: DisplayContext) -> str:
+    labels, root = _interval_table(context)
+    return labels[(pc - root) % 12]
+
+
+def format_semitone(pc: int, context: DisplayContext) -> str:
+    labels, base = _semitone_table(context)
+    return labels[(pc - base) % 12]
+
+
+def resolve_label(pc: int, context: DisplayContext, *, mode: Optional[str] = None) -> str:
+    labels, base = _label_table(context, mode)
+    return labels[(pc - base) % 12]
+
+
+def format_pcs(pcs: Sequence[int], context: DisplayContext, *, mode: Optional[str] = None) -> list[str]:
+    """Batch :func:`resolve_label`: labels come from the context's cached
+    :class:`LabelResolver`, so each is one tuple index."""
+    return label_resolver(context).labels(pcs, mode=mode)
 
 
 def update_context_with_scale(context: DisplayContext, tonic_pc: Optional[int], degrees: Iterable[int]) -> None:
@@ -122,6 +164,9 @@ __all__ = [
     "format_interval",
     "format_semitone",
     "resolve_label",
+    "format_pcs",
+    "LabelResolver",
+    "label_resolver",
     "update_context_with_scale",
     "update_context_with_chord_root",
 ]
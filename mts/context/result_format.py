@@ -25,7 +25,7 @@ from ..analysis.results import (
 )
 from ..core.enharmonics import PC_TO_NAMES
 from .context import DisplayContext
-from .formatters import _INTERVAL_LABELS, format_pitch_class
+from .formatters import _INTERVAL_LABELS, format_pcs, format_pitch_class
 
 
 # ---------------------------------------------------------------------------
@@ -77,16 +77,15 @@ def interval_label(semitones: int, context: DisplayContext) -> str:
     """Label an interval (in semitones) per the context's style."""
     rel = semitones % 12
     if _label_style(context) == "classical":
-        return _INTERVAL_LABELS.get(rel, f"ic{rel}")
+        return _INTERVAL_LABELS[rel]
     return str(rel)
 
 
 def enharmonics_for(pcs: list[int], context: DisplayContext) -> list[EnharmonicChoice]:
     """Preferred + alternate spellings for each pitch class, per context."""
     choices: list[EnharmonicChoice] = []
-    for pc in pcs:
-        preferred = format_pitch_class(pc, context)
-        alternates = [name for name in PC_TO_NAMES.get(pc % 12, []) if name != preferred]
+    for pc, preferred in zip(pcs, format_pcs(pcs, context, mode="names")):
+        alternates = [name for name in PC_TO_NAMES[pc % 12] if name != preferred]
         choices.append(EnharmonicChoice(pc=pc, preferred=preferred, alternates=alternates))
     return choices
 
@@ -101,7 +100,7 @@ def format_chord_analysis(
     """Render a chord analysis: spelled root/notes, interval labels, enharmonics."""
     return ChordAnalysisDisplay(
         root_name=format_pitch_class(result.root_pc, context),
-        note_names=[format_pitch_class(pc, context) for pc in result.pcs],
+        note_names=format_pcs(result.pcs, context, mode="names"),
         interval_labels=[interval_label(iv, context) for iv in result.intervals_relative_to_root],
         enharmonics=enharmonics_for(list(result.pcs), context),
     )
@@ -119,7 +118,7 @@ def format_scale_analysis(
     tonic = result.tonic_pc or 0
     pcs = [(tonic + degree) % 12 for degree in result.degrees]
     return ScaleAnalysisDisplay(
-        note_names=[format_pitch_class(pc, context) for pc in pcs],
+        note_names=format_pcs(pcs, context, mode="names"),
     )
 
 
@@ -20,6 +20,16 @@ def mask_from_pcs(pcs: Iterable[int]) -> int:
     return mask
 
 
+def mask_from_values(values: Iterable[int]) -> int:
+    """:func:`mask_from_pcs` for raw input: ``int()``-coerce, validate and set
+    each bit in one pass. Duplicates and order don't matter; the sorted,
+    de-duplicated pcs are then just ``pcs_from_mask`` of the result."""
+    mask = 0
+    for value in values:
+        mask |= 1 << validate_pc(int(value))
+    return mask
+
+
 def pcs_from_mask(mask: int) -> list[int]:
     return [pc for pc in range(12) if mask & (1 << pc)]
 
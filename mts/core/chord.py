@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 
-from .bitmask import mask_from_pcs, validate_pc, is_subset
+from .bitmask import is_subset, rotate_mask, validate_pc
 from .quality import ChordQuality
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Chord:
     root_pc: int
     quality: ChordQuality
@@ -19,9 +20,20 @@ class Chord:
     def from_quality(cls, root_pc: int, quality: ChordQuality) -> "Chord":
         validate_pc(root_pc)
         pcs = tuple(quality.pcs_from_root(root_pc))
-        mask = mask_from_pcs(pcs)
+        # The chord's pc set is the quality's interval set transposed to the root.
+        mask = rotate_mask(quality.mask, root_pc)
         return cls(root_pc=root_pc, quality=quality, pcs=pcs, mask=mask)
 
 
 def chord_in_scale(chord: Chord, scale_mask: int) -> bool:
     return is_subset(chord.mask, scale_mask)
+
+
+def chords_in_scale(chord_masks: Iterable[int], scale_mask: int) -> list[bool]:
+    """:func:`chord_in_scale` over many chord masks against one scale.
+
+    The scale's complement is taken once; each chord is then a single AND
+    (a chord fits iff it has no tone outside the scale).
+    """
+    outside = ~scale_mask & 0xFFF
+    return [not mask & outside for mask in chord_masks]
@@ -2,25 +2,30 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from types import MappingProxyType
+from typing import Literal, Mapping
 
 
 SpellingPref = Literal["auto", "sharps", "flats"]
 
-PC_TO_NAMES: dict[int, list[str]] = {
-    0: ["C", "B#", "Dbb"],
-    1: ["C#", "Db"],
-    2: ["D", "C##", "Ebb"],
-    3: ["D#", "Eb", "Fbb"],
-    4: ["E", "Fb", "D##"],
-    5: ["F", "E#", "Gbb"],
-    6: ["F#", "Gb", "E##"],
-    7: ["G", "F##", "Abb"],
-    8: ["G#", "Ab"],
-    9: ["A", "G##", "Bbb"],
-    10: ["A#", "Bb", "Cbb"],
-    11: ["B", "Cb", "A##"],
-}
+# Spellings of each pitch class, indexed by pc (dense 0..11, so a tuple index
+# rather than a dict lookup); the first entry is the canonical sharp-side name.
+_PC_TO_NAMES: tuple[tuple[str, ...], ...] = (
+    ("C", "B#", "Dbb"),
+    ("C#", "Db"),
+    ("D", "C##", "Ebb"),
+    ("D#", "Eb", "Fbb"),
+    ("E", "Fb", "D##"),
+    ("F", "E#", "Gbb"),
+    ("F#", "Gb", "E##"),
+    ("G", "F##", "Abb"),
+    ("G#", "Ab"),
+    ("A", "G##", "Bbb"),
+    ("A#", "Bb", "Cbb"),
+    ("B", "Cb", "A##"),
+)
+# Public pc -> spellings mapping (read-only; same keys as the original dict).
+PC_TO_NAMES: Mapping[int, tuple[str, ...]] = MappingProxyType(dict(enumerate(_PC_TO_NAMES)))
 
 def _prefer_from_key_signature(sig: int | None, fallback: SpellingPref) -> SpellingPref:
     """
@@ -35,9 +40,9 @@ def _prefer_from_key_signature(sig: int | None, fallback: SpellingPref) -> Spell
         return "flats"
     return fallback
 
-def name_for_pc(pc: int, *, prefer: SpellingPref = "auto", key_signature: int | None = None) -> str:
+def _policy_name(names: tuple[str, ...], eff: SpellingPref) -> str:
     """
-    Choose a practical display name for a pitch class.
+    Choose a practical display name among one pitch class's spellings.
     Rules:
       1) Prefer naturals if present.
       2) If both flat and sharp options exist, honor preference (key_signature or 'prefer'),
@@ -45,15 +50,22 @@ def name_for_pc(pc: int, *, prefer: SpellingPref = "auto", key_signature: int |
       3) If only one family exists (only flats or only sharps), prefer single accidentals.
       4) Else fall back to the first canonical name.
     """
-    names = PC_TO_NAMES.get(pc % 12, [f"pc{pc%12}"])
-    eff = _prefer_from_key_signature(key_signature, prefer)
-
-    # Buckets
-    naturals = [n for n in names if ("b" not in n and "#" not in n)]
-    single_flats = [n for n in names if "b" in n and "bb" not in n]
-    multi_flats  = [n for n in names if "bb" in n]
-    single_sharps = [n for n in names if "#" in n and "##" not in n]
-    multi_sharps  = [n for n in names if "##" in n]
+    # Buckets, filled in one pass classified by accidental counts (the letter
+    # is upper-case, so every lower-case "b" is a flat).
+    naturals: list[str] = []
+    single_flats: list[str] = []
+    multi_flats: list[str] = []
+    single_sharps: list[str] = []
+    multi_sharps: list[str] = []
+    for n in names:
+        sharps = n.count("#")
+        flats = n.count("b")
+        if sharps:
+            (single_sharps if sharps == 1 else multi_sharps).append(n)
+        elif flats:
+            (single_flats if flats == 1 else multi_flats).append(n)
+        else:
+            naturals.append(n)
 
     # 1) Naturals win when available
     if naturals:
@@ -85,9 +97,39 @@ def name_for_pc(pc: int, *, prefer: SpellingPref = "auto", key_signature: int |
     return names[0]
 
 
-# Back-compat helper (used by early code); keep but route through policy-aware function.
+# The policy above runs once per (pc, preference) at import; lookups are then
+# two tuple indexes. Columns follow _PREF_COLUMN; any other preference value
+# behaves like "auto" (i.e. not "flats"), as the policy always has.
+_PREF_COLUMN: dict[str, int] = {"auto": 0, "sharps": 1, "flats": 2}
+_NAMES_BY_COLUMN: tuple[tuple[str, ...], ...] = tuple(
+    tuple(_policy_name(names, pref) for names in _PC_TO_NAMES)
+    for pref in ("auto", "sharps", "flats")
+)
+
+
+def name_for_pc(pc: int, *, prefer: SpellingPref = "auto", key_signature: int | None = None) -> str:
+    """
+    Practical display name for a pitch class under the spelling policy of
+    :func:`_policy_name` (naturals first; otherwise the preferred family, where
+    a non-zero key_signature overrides ``prefer``).
+    """
+    eff = _prefer_from_key_signature(key_signature, prefer)
+    return _NAMES_BY_COLUMN[_PREF_COLUMN.get(eff, 0)][pc % 12]
+
+
+def pc_names(prefer: SpellingPref = "auto", key_signature: int | None = None) -> tuple[str, ...]:
+    """All twelve :func:`name_for_pc` spellings for one preference, indexed by pc.
+
+    A key signature only ever matters by its sign, so there are just three
+    distinct tables; renderers naming many pads under one policy index this
+    instead of resolving the preference per pad.
+    """
+    return _NAMES_BY_COLUMN[_PREF_COLUMN.get(_prefer_from_key_signature(key_signature, prefer), 0)]
+
+
+# Back-compat helper (used by early code); keep but read the policy table's "auto" column.
 def primary_name(pc: int) -> str:
-    return name_for_pc(pc, prefer="auto", key_signature=None)
+    return _NAMES_BY_COLUMN[0][pc % 12]
 
 # ---------- CLI-friendly parsing helpers ----------
 
@@ -105,25 +147,52 @@ def _normalize_note_str(s: str) -> str:
         s = s.replace(k, v)
     return s.capitalize()  # c# -> C#
 
-# Build a reverse map from common spellings to pitch-class integers.
-_NAME_TO_PC: dict[str, int] = {}
-for pc, names in PC_TO_NAMES.items():
-    for n in names:
-        _NAME_TO_PC[n] = pc
-# Add a few super-common fallbacks explicitly
-_NAME_TO_PC.update({
-    "Db": 1, "C#": 1,
-    "Eb": 3, "D#": 3,
-    "Gb": 6, "F#": 6,
-    "Ab": 8, "G#": 8,
-    "Bb": 10, "A#": 10,
+# Reverse map from every listed spelling in _PC_TO_NAMES to its pitch class,
+# written out rather than built at import; read-only so it can't drift.
+_NAME_TO_PC: Mapping[str, int] = MappingProxyType({
+    "C": 0, "B#": 0, "Dbb": 0,
+    "C#": 1, "Db": 1,
+    "D": 2, "C##": 2, "Ebb": 2,
+    "D#": 3, "Eb": 3, "Fbb": 3,
+    "E": 4, "Fb": 4, "D##": 4,
+    "F": 5, "E#": 5, "Gbb": 5,
+    "F#": 6, "Gb": 6, "E##": 6,
+    "G": 7, "F##": 7, "Abb": 7,
+    "G#": 8, "Ab": 8,
+    "A": 9, "G##": 9, "Bbb": 9,
+    "A#": 10, "Bb": 10, "Cbb": 10,
+    "B": 11, "Cb": 11, "A##": 11,
 })
 
+# Fast path for the common ASCII spellings: every canonical key plus its
+# lower-case form, each already equal to what _normalize_note_str would give.
+_NAME_TO_PC_CI: Mapping[str, int] = MappingProxyType({
+    **_NAME_TO_PC,
+    "c": 0, "b#": 0, "dbb": 0,
+    "c#": 1, "db": 1,
+    "d": 2, "c##": 2, "ebb": 2,
+    "d#": 3, "eb": 3, "fbb": 3,
+    "e": 4, "fb": 4, "d##": 4,
+    "f": 5, "e#": 5, "gbb": 5,
+    "f#": 6, "gb": 6, "e##": 6,
+    "g": 7, "f##": 7, "abb": 7,
+    "g#": 8, "ab": 8,
+    "a": 9, "g##": 9, "bbb": 9,
+    "a#": 10, "bb": 10, "cbb": 10,
+    "b": 11, "cb": 11, "a##": 11,
+})
+
+
 def pc_from_name(name: str) -> int:
     """
     Parse a note name like 'C', 'Db', 'F#', 'Cb', 'E#' into a pitch class 0..11.
     Accepts unicode ♯/♭ and normalizes.
     """
+    pc = _NAME_TO_PC_CI.get(name)
+    if pc is None:
+        pc = _NAME_TO_PC_CI.get(name.strip())
+    if pc is not None:
+        return pc
     key = _normalize_note_str(name)
     if key in _NAME_TO_PC:
         return _NAME_TO_PC[key]
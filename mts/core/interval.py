@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Interval:
     semitones: int
     name: str
@@ -32,3 +32,29 @@ class Interval:
             ratio=(str(data["ratio"]) if data.get("ratio") is not None else None),
             category=(str(data["category"]) if data.get("category") is not None else None),
         )
+
+    @classmethod
+    def from_trusted_dict(cls, data: Mapping[str, Any]) -> Interval:
+        """Build from a mapping whose values already have the field types.
+
+        For in-memory dicts (e.g. ``dataclasses.asdict`` output); JSON input
+        goes through :meth:`from_dict`, which coerces. Optional fields may be
+        omitted.
+        """
+        return cls(
+            semitones=data["semitones"],
+            name=data["name"],
+            verbal=data["verbal"],
+            diatonic_class=data["diatonic_class"],
+            quality=data["quality"],
+            inversion=data["inversion"],
+            cents=data.get("cents"),
+            ratio=data.get("ratio"),
+            category=data.get("category"),
+        )
+
+    @classmethod
+    def many_from_dicts(cls, items: Iterable[Mapping[str, Any]]) -> list[Interval]:
+        """Batch :meth:`from_trusted_dict`."""
+        build = cls.from_trusted_dict
+        return [build(data) for data in items]
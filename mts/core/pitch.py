@@ -3,15 +3,40 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import re
+from collections.abc import Iterable
 from typing import NamedTuple
 
 from .enharmonics import pc_from_name
 
-_NOTE_RE = re.compile(r"^([A-Ga-g][#b]{0,2})(-?\d+)?$")
+# int() can never parse a token opening with a note letter, so those skip the
+# integer attempt (and its raised-and-caught ValueError) outright.
+_NOTE_LETTERS = frozenset("ABCDEFGabcdefg")
 
 
-@dataclass(frozen=True)
+def _split_note_token(token: str) -> tuple[str, str | None] | None:
+    r"""``(note_name, octave_text)`` for a stripped token matching
+    ``^([A-Ga-g][#b]{0,2})(-?\d+)?$``, or ``None`` on no match.
+
+    A straight left-to-right scan (letter, up to two of ``#``/``b``, then an
+    optional ``-?digits`` octave): the grammar never needs backtracking, so
+    this is the regex's DFA written out.
+    """
+    if not token or token[0] not in _NOTE_LETTERS:
+        return None
+    end = 1
+    while end < 3 and end < len(token) and token[end] in "#b":
+        end += 1
+    octave = token[end:]
+    if not octave:
+        return token, None
+    digits = octave[1:] if octave[0] == "-" else octave
+    # str.isdecimal is exactly re's \d (Unicode category Nd) for str patterns.
+    if not digits.isdecimal():
+        return None
+    return token[:end], octave
+
+
+@dataclass(frozen=True, slots=True)
 class Pitch:
     """Absolute pitch with optional performance metadata.
 
@@ -45,6 +70,11 @@ class Pitch:
         velocity: int | None = None,
         channel: int | None = None,
     ) -> "Pitch":
+        if velocity is None and channel is None and cls is Pitch:
+            # Flyweight: the bare MIDI-range pitches are prebuilt (below), so
+            # the common no-metadata case is a tuple index, not a new object.
+            if type(midi) is int and 0 <= midi < 128:
+                return _MIDI_PITCHES[midi]
         midi_int = int(midi)
         pc = midi_int % 12
         octave = midi_int // 12 - 1  # MIDI octave convention (C4 == 60)
@@ -70,6 +100,12 @@ class Pitch:
         return cls.from_midi(midi, velocity=velocity, channel=channel)
 
 
+# Frozen, so one shared instance per bare MIDI number is safe.
+_MIDI_PITCHES: tuple[Pitch, ...] = tuple(
+    Pitch(midi=midi, pc=midi % 12, octave=midi // 12 - 1) for midi in range(128)
+)
+
+
 class ParsedPitch(NamedTuple):
     pc: int
     pitch: Pitch | None
@@ -84,11 +120,13 @@ def parse_pitch_token(token: str) -> ParsedPitch:
     if not stripped:
         raise ValueError("Empty pitch token.")
 
-    # First attempt integer parsing
-    try:
-        value = int(stripped)
-    except ValueError:
-        value = None
+    # First attempt integer parsing (note-letter tokens cannot be integers)
+    value = None
+    if stripped[0] not in _NOTE_LETTERS:
+        try:
+            value = int(stripped)
+        except ValueError:
+            pass
     if value is not None:
         if value < 0:
             # "-3" used to silently wrap to pc 9 — an input error, not a pc.
@@ -102,10 +140,10 @@ def parse_pitch_token(token: str) -> ParsedPitch:
         return ParsedPitch(pc=pitch.pc, pitch=pitch, token=stripped, is_note_token=False)
 
     # Match note name with optional octave
-    match = _NOTE_RE.match(stripped)
-    if not match:
+    split = _split_note_token(stripped)
+    if split is None:
         raise ValueError(f"Unrecognized pitch token {token!r}.")
-    note_name, octave_text = match.groups()
+    note_name, octave_text = split
     pc = pc_from_name(note_name)
     pitch = None
     if octave_text is not None:
@@ -113,3 +151,7 @@ def parse_pitch_token(token: str) -> ParsedPitch:
         pitch = Pitch.from_components(pc=pc, octave=octave)
     return ParsedPitch(pc=pc, pitch=pitch, token=stripped, is_note_token=True)
 
+
+def parse_pitch_tokens(tokens: Iterable[str]) -> list[ParsedPitch]:
+    """:func:`parse_pitch_token` over a token stream (blank tokens skipped)."""
+    return [parse_pitch_token(t) for t in tokens if t.strip()]
@@ -5,10 +5,10 @@ from __future__ import annotations
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 
-from .bitmask import mask_from_pcs, validate_pc
+from .bitmask import mask_from_values, pcs_from_mask, validate_pc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChordQuality:
     name: str
     intervals: tuple[int, ...]
@@ -26,7 +26,8 @@ class ChordQuality:
     ) -> "ChordQuality":
         # Validate BEFORE normalizing: the old `% 12` wrapped out-of-range
         # intervals silently, so the validate_pc pass below could never fire.
-        normalized_intervals = tuple(sorted({validate_pc(int(iv)) for iv in intervals}))
+        mask = mask_from_values(intervals)
+        normalized_intervals = tuple(pcs_from_mask(mask))
         normalized_tensions = tuple(
             sorted({validate_pc(int(tv)) for tv in (tensions or [])})
         )
@@ -34,7 +35,6 @@ class ChordQuality:
         normalized_aliases = tuple(
             dict.fromkeys(str(a).strip() for a in (aliases or []) if str(a).strip())
         )
-        mask = mask_from_pcs(normalized_intervals)
         return cls(
             name=name,
             intervals=normalized_intervals,
@@ -4,12 +4,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from collections.abc import Iterable
+from functools import lru_cache
 
-from .bitmask import mask_from_pcs, validate_pc
+from .bitmask import complement_mask, mask_from_values, pcs_from_mask, rotate_mask, validate_pc
 from .symmetry import rotational_period
 
 
-@dataclass(frozen=True)
+def _normalize_aliases(aliases: Iterable[str] | None) -> tuple[str, ...]:
+    return tuple(sorted({str(alias).strip() for alias in (aliases or []) if str(alias).strip()}))
+
+
+@dataclass(frozen=True, slots=True)
 class Scale:
     name: str
     degrees: tuple[int, ...]
@@ -22,18 +27,16 @@ class Scale:
     ) -> "Scale":
         # Validate BEFORE normalizing: a degree of 12 or -1 is an input error,
         # not a pc to silently wrap (mask_from_pcs raises; so does this).
-        normalized = tuple(sorted({validate_pc(int(pc)) for pc in degrees}))
-        mask = mask_from_pcs(normalized)
-        alias_values = tuple(sorted({str(alias).strip() for alias in (aliases or []) if str(alias).strip()}))
-        return cls(name=name, degrees=normalized, mask=mask, aliases=alias_values)
+        mask = mask_from_values(degrees)
+        normalized = tuple(pcs_from_mask(mask))
+        return cls(name=name, degrees=normalized, mask=mask, aliases=_normalize_aliases(aliases))
 
     def contains(self, pc: int) -> bool:
         validate_pc(pc)
         return bool(self.mask & (1 << pc))
 
     def transpose(self, semitones: int) -> "Scale":
-        transposed_degrees = [((pc + semitones) % 12) for pc in self.degrees]
-        return Scale.from_degrees(f"{self.name}+{semitones}", transposed_degrees, self.aliases)
+        return _transposed(self.name, self.mask, self.aliases, semitones)
 
     @property
     def rotational_period(self) -> int:
@@ -46,7 +49,7 @@ class Scale:
         return list(self.degrees)
 
     def complementary_pcs(self) -> list[int]:
-        return [pc for pc in range(12) if pc not in self.degrees]
+        return pcs_from_mask(complement_mask(self.mask))
 
     def __str__(self) -> str:
         pcs = ",".join(str(pc) for pc in self.degrees)
@@ -54,3 +57,17 @@ class Scale:
             aliases = ",".join(self.aliases)
             return f"Scale(name={self.name}, degrees=[{pcs}], aliases=[{aliases}])"
         return f"Scale(name={self.name}, degrees=[{pcs}])"
+
+
+@lru_cache(maxsize=4096)
+def _transposed(name: str, mask: int, aliases: tuple[str, ...], semitones: int) -> Scale:
+    # A scale has at most 12 transpositions and callers (mode rotation) ask
+    # for the same ones repeatedly; rotating the mask skips re-validation and
+    # the degree sort. Scale is frozen, so handing out one instance is safe.
+    rotated = rotate_mask(mask, semitones)
+    return Scale(
+        name=f"{name}+{semitones}",
+        degrees=tuple(pcs_from_mask(rotated)),
+        mask=rotated,
+        aliases=_normalize_aliases(aliases),
+    )
@@ -0,0 +1,18 @@
+"""Pitch-class-indexed label tables shared across the display edge.
+
+Dense 12-tuples (index = pc 0..11, or a pc relative to some base), so a label
+is one tuple index. Pure data: spelling *policy* lives in ``enharmonics``.
+"""
+
+from __future__ import annotations
+
+# Scale-degree label of each semitone above the tonic.
+DEGREE_LABELS: tuple[str, ...] = ("1", "b2", "2", "b3", "3", "4", "#4", "5", "b6", "6", "b7", "7")
+
+# Interval-class label of each semitone distance above a root.
+INTERVAL_LABELS: tuple[str, ...] = ("P1", "m2", "M2", "m3", "M3", "P4", "TT", "P5", "m6", "M6", "m7", "M7")
+
+# Circle-of-fifths index of the major key on each tonic (F# = +6, not Gb).
+KEY_SIGNATURE_BY_TONIC: tuple[int, ...] = (0, -5, 2, -3, 4, -1, 6, 1, -4, 3, -2, 5)
+
+__all__ = ["DEGREE_LABELS", "INTERVAL_LABELS", "KEY_SIGNATURE_BY_TONIC"]
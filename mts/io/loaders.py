@@ -925,9 +925,6 @@ def load_function_mappings(
             "(the legacy static function tables were removed)."
         )
 
-    scales = load_scales()
-    chord_qualities = load_chord_qualities()
-
     if mode_key == "major":
         scale_name = "Ionian"
         template_collection = TEMPLATES_MAJOR if templates is None else templates
@@ -941,10 +938,6 @@ def load_function_mappings(
     else:
         raise ValueError(f"Unsupported mode: {mode}")
 
-    if scale_name not in scales:
-        raise ValueError(f"Scale {scale_name!r} required for mode {mode} was not loaded")
-    scale = scales[scale_name]
-
     feature_set: set[str] = set(default_features)
     if features:
         feature_set.update(features)
@@ -968,6 +961,13 @@ def load_function_mappings(
         if cached is not None and cached[0] == source_mtime and cache_key in cached[1]:
             return cached[1][cache_key]
 
+    # Catalogs are only needed to generate — a cache hit never copies them.
+    scales = load_scales()
+    chord_qualities = load_chord_qualities()
+    if scale_name not in scales:
+        raise ValueError(f"Scale {scale_name!r} required for mode {mode} was not loaded")
+    scale = scales[scale_name]
+
     generated = generate_functions_for_scale(
         scale,
         chord_qualities,
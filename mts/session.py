@@ -17,7 +17,7 @@ from pathlib import Path
 import json
 import os
 import sys
-from typing import Iterable, Mapping, Sequence, cast
+from typing import AbstractSet, Iterable, Mapping, Sequence, cast
 
 from .core.bitmask import mask_from_pcs, pcs_from_mask
 from .core.enharmonics import pc_from_name
@@ -239,7 +239,7 @@ _SAVE_SESSION_ERROR_REPORTED = False
 # Builder dataclasses
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ManualScaleBuilder:
     name: str | None
     degrees: Sequence[int | str]
@@ -257,7 +257,7 @@ class ManualScaleBuilder:
         return Scale.from_degrees(name, normalized)
 
 
-@dataclass
+@dataclass(slots=True)
 class ManualChordBuilder:
     name: str | None
     intervals: Sequence[int | str]
@@ -301,10 +301,14 @@ class ManualChordBuilder:
 # ---------------------------------------------------------------------------
 
 def _placeholder_name(stem: str, registry: Mapping[str, object], existing: Iterable[str]) -> str:
-    taken = set(registry.keys()) | set(existing)
+    # Probe the registry and key views in place rather than copying both into a
+    # fresh union per allocation; only a plain iterable needs materializing.
+    # (No per-stem counter: that would be module-level state shared across
+    # sessions, and names must stay a pure function of the session's contents.)
+    taken = existing if isinstance(existing, AbstractSet) else set(existing)
     for idx in count(1):
         candidate = f"{stem}-{idx}"
-        if candidate not in taken:
+        if candidate not in registry and candidate not in taken:
             return candidate
     return stem
 
@@ -500,7 +504,7 @@ def mask_from_text(text: str) -> int:
     stripped = text.strip().lower()
     if stripped.startswith("0b"):
         value = int(stripped[2:], 2)
-    elif stripped and set(stripped) <= {"0", "1"}:
+    elif stripped and not stripped.strip("01"):  # all 0/1, no set built
         if len(stripped) == 12:
             value = int(stripped, 2)
         else:
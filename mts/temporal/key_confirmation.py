@@ -188,12 +188,13 @@ def confirm_key_areas(
         ))
 
     claimable = [a for a in areas if a.claim_possible]
+    confirmed_areas = sum(1 for a in claimable if a.confirmed)
     return KeyAreaConfirmationResult(
         home_tonic_pc=result.home_tonic_pc,
         home_mode=result.home_mode,
         areas=areas,
-        confirmed_areas=sum(1 for a in claimable if a.confirmed),
-        unconfirmed_areas=sum(1 for a in claimable if not a.confirmed),
+        confirmed_areas=confirmed_areas,
+        unconfirmed_areas=len(claimable) - confirmed_areas,
         no_claim_areas=len(areas) - len(claimable),
     )
 
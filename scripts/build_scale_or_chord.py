@@ -17,7 +17,7 @@ from mts.analysis import (
     ManualChordBuilder,
     ParsedPitch,
     chord_brief,
-    parse_pitch_token,
+    parse_pitch_tokens,
 )
 from mts.session import (
     degrees_from_mask,
@@ -36,12 +36,7 @@ _session = SessionCatalog()
 def _parse_pitch_list(text: str | None) -> tuple[list[int], list[ParsedPitch]]:
     if text is None:
         return [], []
-    parsed: list[ParsedPitch] = []
-    for token in text.split(","):
-        stripped = token.strip()
-        if not stripped:
-            continue
-        parsed.append(parse_pitch_token(stripped))
+    parsed = parse_pitch_tokens(text.split(","))
     pcs = [item.pc for item in parsed]
     return pcs, parsed
 
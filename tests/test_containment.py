@@ -31,6 +31,16 @@ def test_containing_roots_is_the_reverse_of_compatibility():
     assert len(containing_roots(ionian.mask, 0b1)) == 7
 
 
+def test_batched_compatibility_roots_match_the_per_pair_form():
+    from mts.analysis.pcset_math import compatibility_roots, compatibility_roots_across
+    from mts.io.loaders import load_chord_qualities, load_scales
+
+    scales = list(load_scales().values())
+    for quality in load_chord_qualities().values():
+        batched = compatibility_roots_across((s.mask for s in scales), quality.mask)
+        assert batched == [compatibility_roots(s, quality) for s in scales]
+
+
 # --- the query -----------------------------------------------------------------------
 
 
@@ -115,3 +125,14 @@ def test_result_is_json_ready():
     decoded = json.loads(payload)
     assert decoded["query_mask"] == 0b000010010001
     assert decoded["scales"][0]["name"]
+
+
+def test_chords_in_scale_batch_matches_subset_test():
+    from mts.core.bitmask import is_subset
+    from mts.core.chord import chords_in_scale
+
+    chord_masks = list(range(0, 4096, 7))
+    for scale_mask in (0, 0xAB5, 0x5AD, 0xFFF):
+        assert chords_in_scale(chord_masks, scale_mask) == [
+            is_subset(mask, scale_mask) for mask in chord_masks
+        ]
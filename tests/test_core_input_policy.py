@@ -87,3 +87,51 @@ def test_empty_set_convention_matches_core_everywhere():
     # used to hardcode period 0 for empty inputs, disagreeing with both.
     assert rotational_period(0) == 1
     assert rotational_steps(0) == tuple(range(1, 12))
+
+
+def test_note_token_scanner_matches_reference_grammar():
+    import itertools
+    import re
+
+    from mts.core.pitch import _split_note_token
+
+    note_re = re.compile(r"^([A-Ga-g][#b]{0,2})(-?\d+)?$")  # the reference grammar
+
+    alphabet = ["C", "g", "H", "#", "b", "-", "4", "1", "x"]
+    for size in range(6):
+        for combo in itertools.product(alphabet, repeat=size):
+            token = "".join(combo)
+            match = note_re.match(token)
+            assert _split_note_token(token) == (match.groups() if match else None)
+
+
+def test_parse_pitch_tokens_skips_blanks():
+    from mts.core.pitch import parse_pitch_tokens
+
+    parsed = parse_pitch_tokens(["C4", " ", "Eb", "67"])
+    assert [p.pc for p in parsed] == [0, 3, 7]
+    assert parsed[0].pitch == Pitch.from_midi(60)
+
+
+def test_bare_midi_pitches_are_shared_and_equal_to_built_ones():
+    assert Pitch.from_midi(60) is Pitch.from_midi(60)
+    assert Pitch.from_midi(60) == Pitch(midi=60, pc=0, octave=4)
+    assert Pitch.from_components(pc=0, octave=4) is Pitch.from_midi(60)
+    with_velocity = Pitch.from_midi(60, velocity=90)
+    assert with_velocity.velocity == 90 and with_velocity is not Pitch.from_midi(60)
+    assert Pitch.from_midi(200).octave == 15  # outside the prebuilt range
+
+
+def test_trusted_interval_builders_match_from_dict():
+    from dataclasses import asdict
+
+    from mts.core.interval import Interval
+    from mts.io.loaders import load_intervals
+
+    intervals = load_intervals()
+    dicts = [asdict(iv) for iv in intervals]
+    assert [Interval.from_trusted_dict(d) for d in dicts] == intervals
+    assert Interval.many_from_dicts(dicts) == intervals
+    sparse = {k: v for k, v in dicts[0].items() if k not in ("cents", "ratio", "category")}
+    assert Interval.from_trusted_dict(sparse) == Interval.from_dict(sparse)
+    assert Interval.many_from_dicts([sparse]) == [Interval.from_dict(sparse)]
@@ -23,3 +23,49 @@ def test_push_session_chord_summary_runs():
     # maj7 is a seventh chord: 4 inversions, and closed is always a valid voicing.
     assert summary.startswith("4 inversions")
     assert "closed" in summary
+
+
+def test_push_feature_choices_track_theory_feature_constants():
+    """The hard-coded CLI choices are exactly the opt-in FEATURE_* flags."""
+    from mts.cli.push import _FUNCTION_FEATURE_CHOICES
+    from mts.theory import functions as fn_defs
+
+    features = {
+        value
+        for name, value in vars(fn_defs).items()
+        if name.startswith("FEATURE_") and value != fn_defs.FEATURE_DIATONIC
+    }
+    assert _FUNCTION_FEATURE_CHOICES == tuple(sorted(features))
+
+
+def test_push_grid_batch_updates_rebuild_once_at_exit():
+    from mts.cli.push_grid import PushGrid
+
+    grid = PushGrid()
+    before = grid.cells
+    with grid.batch_updates():
+        grid.set_key(2, [0, 2, 4, 5, 7, 9, 11])
+        with grid.batch_updates():
+            grid.set_display(layout_mode="in_scale", spelling="flats")
+        assert grid.cells is before  # still deferred inside the outer block
+        grid.set_chord([2, 6, 9], 2)
+    expected = PushGrid(
+        tonic_pc=2, scale_degrees_rel=[0, 2, 4, 5, 7, 9, 11], chord_pcs_abs=[2, 6, 9],
+        chord_root_pc=2, layout_mode="in_scale", spelling="flats",
+    )
+    assert grid.cells is not before
+    assert grid.render_lines() == expected.render_lines()
+
+
+def test_push_grid_setters_intern_mode_strings():
+    import sys
+
+    from mts.cli.push_grid import PushGrid
+
+    grid = PushGrid()
+    grid.set_preset("".join(["fou", "rths"]))
+    grid.set_anchor("".join(["fixed_", "C"]))
+    grid.set_origin("".join(["up", "per"]))
+    assert grid.preset is sys.intern("fourths")
+    assert grid.anchor is sys.intern("fixed_C")
+    assert grid.origin is sys.intern("upper")
@@ -0,0 +1,173 @@
+"""DisplayContext layer resolution: top-most layer wins, and every way of
+changing a layer is visible to the next read (the resolved view is cached)."""
+
+import copy
+import gc
+import pickle
+import weakref
+
+import pytest
+
+from mts.context import DisplayContext, DisplayLayer
+
+
+def test_topmost_layer_wins_and_defaults_show_through():
+    ctx = DisplayContext()
+    assert ctx.get("spelling") == "auto"
+    ctx.set("spelling", "flats", layer="cli")
+    assert ctx.get("spelling") == "flats"
+    assert ctx.get("label_mode") == "names"
+    assert ctx.get("missing", "fallback") == "fallback"
+
+
+def test_push_and_pop_change_resolution():
+    ctx = DisplayContext()
+    ctx.get("spelling")  # warm the resolved view
+    view = DisplayLayer(name="view", settings={"spelling": "sharps"})
+    ctx.push_layer(view)
+    assert ctx.get("spelling") == "sharps"
+    ctx.pop_layer(name="view")
+    assert ctx.get("spelling") == "auto"
+
+
+def test_direct_layer_set_is_seen_while_attached_only():
+    ctx = DisplayContext()
+    view = DisplayLayer(name="view")
+    ctx.push_layer(view)
+    ctx.get("spelling")
+    view.set("spelling", "flats")
+    assert ctx.get("spelling") == "flats"
+    ctx.pop_layer()
+    view.set("spelling", "sharps")  # detached: no effect on the context
+    assert ctx.get("spelling") == "auto"
+
+
+def test_from_dict_resolves_the_restored_layers():
+    src = DisplayContext()
+    src.set("spelling", "flats", layer="cli")
+    ctx = DisplayContext.from_dict(src.to_dict())
+    assert ctx.get("spelling") == "flats"
+    ctx.set("spelling", "sharps", layer="cli")
+    assert ctx.get("spelling") == "sharps"
+
+
+def test_defaults_layer_is_shared_frozen_and_thawed_on_write():
+    a, b = DisplayContext(), DisplayContext()
+    assert a._layers[0] is b._layers[0]
+    assert a._layers[0].frozen
+    a.set("spelling", "flats", layer="defaults")
+    assert a.get("spelling") == "flats"
+    assert b.get("spelling") == "auto"  # the shared layer was not touched
+
+
+def test_frozen_layer_refuses_direct_set():
+    layer = DisplayLayer(name="fixed", settings={"spelling": "flats"}, frozen=True)
+    with pytest.raises(TypeError):
+        layer.set("spelling", "sharps")
+
+
+def test_listener_removing_itself_mid_dispatch_does_not_skip_others():
+    ctx = DisplayContext()
+    seen: list[str] = []
+
+    def once(event, payload):
+        seen.append("once")
+        ctx.remove_listener(once)
+
+    def always(event, payload):
+        seen.append("always")
+
+    ctx.add_listener(once)
+    ctx.add_listener(always)
+    ctx.set("spelling", "flats")
+    ctx.set("spelling", "sharps")
+    assert seen == ["once", "always", "always"]
+
+
+def test_to_dict_without_copy_is_a_read_only_live_view():
+    ctx = DisplayContext()
+    ctx.set("spelling", "flats")
+    view = ctx.to_dict(copy=False)
+    assert view == ctx.to_dict()
+    session = view["layers"][1]["settings"]
+    with pytest.raises(TypeError):
+        session["spelling"] = "sharps"
+    ctx.set("spelling", "sharps")
+    assert session["spelling"] == "sharps"
+
+
+def test_set_targets_lowest_same_named_layer_after_pushes_and_pops():
+    ctx = DisplayContext()
+    low = DisplayLayer(name="view", settings={})
+    high = DisplayLayer(name="view", settings={})
+    ctx.push_layer(low)
+    ctx.push_layer(high)
+    ctx.set("spelling", "flats", layer="view")
+    assert low.settings == {"spelling": "flats"} and high.settings == {}
+    ctx.pop_layer(name="view")  # pops the top-most match
+    ctx.pop_layer(name="view")
+    ctx.set("spelling", "sharps", layer="view")  # recreated on top
+    assert ctx._layers[-1].name == "view" and ctx.get("spelling") == "sharps"
+    assert low.settings == {"spelling": "flats"}
+
+
+def test_listener_with_keys_only_hears_those_settings():
+    ctx = DisplayContext()
+    seen: list[tuple[str, object]] = []
+    ctx.add_listener(lambda event, payload: seen.append((event, payload)), keys=["spelling"])
+    ctx.set("label_mode", "degrees")
+    ctx.set("spelling", "flats")
+    ctx.push_layer(DisplayLayer(name="view"))
+    assert seen == [
+        ("setting_changed", {"key": "spelling", "value": "flats", "layer": "session"}),
+        ("layer_added", "view"),
+    ]
+
+
+def test_layer_settings_are_read_only_so_the_resolved_view_stays_current():
+    ctx = DisplayContext()
+    layer = DisplayLayer(name="u", settings={"spelling": "sharps"})
+    ctx.push_layer(layer)
+    assert ctx.get("spelling") == "sharps"
+    with pytest.raises(TypeError):
+        layer.settings["spelling"] = "flats"
+    layer.set("spelling", "flats")
+    assert ctx.get("spelling") == "flats"
+
+
+def test_shared_layer_does_not_keep_contexts_alive():
+    shared = DisplayLayer(name="shared", settings={})
+    ctx = DisplayContext()
+    ctx.push_layer(shared)
+    ref = weakref.ref(ctx)
+    del ctx
+    gc.collect()
+    assert ref() is None
+    shared.set("spelling", "flats")  # dead watcher is skipped and pruned
+    assert shared._watchers == []
+
+
+def test_context_round_trips_through_deepcopy_and_pickle():
+    ctx = DisplayContext()
+    ctx.set("spelling", "flats")
+    ctx.push_layer(DisplayLayer(name="view", settings={"label_mode": "degrees"}))
+    for clone in (copy.deepcopy(ctx), pickle.loads(pickle.dumps(ctx))):
+        assert clone.to_dict() == ctx.to_dict()
+        view = clone._layers[-1]
+        view.set("label_mode", "intervals")  # restored layers still invalidate
+        assert clone.get("label_mode") == "intervals"
+        clone.set("spelling", "sharps")
+        assert clone.get("spelling") == "sharps"
+    assert ctx.get("spelling") == "flats" and ctx.get("label_mode") == "degrees"
+    assert pickle.loads(pickle.dumps(DisplayContext())).get("spelling") == "auto"
+
+
+def test_watched_layer_copies_drop_watchers_and_own_their_settings():
+    ctx = DisplayContext()
+    layer = DisplayLayer(name="view", settings={"spelling": "flats"})
+    ctx.push_layer(layer)
+    for clone in (copy.copy(layer), copy.deepcopy(layer), pickle.loads(pickle.dumps(layer))):
+        assert clone == layer and clone._watchers == []
+        clone.set("spelling", "sharps")
+        assert layer.get("spelling") == "flats" and ctx.get("spelling") == "flats"
+        assert clone.settings == {"spelling": "sharps"}
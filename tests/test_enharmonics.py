@@ -0,0 +1,63 @@
+"""Enharmonic naming policy: precomputed tables agree with name_for_pc."""
+
+import pytest
+
+from mts.core.enharmonics import (
+    _NAME_TO_PC,
+    _NAME_TO_PC_CI,
+    PC_TO_NAMES,
+    _normalize_note_str,
+    name_for_pc,
+    pc_from_name,
+    pc_names,
+)
+
+
+def test_pc_names_matches_name_for_pc_for_every_policy():
+    for prefer in ("auto", "sharps", "flats"):
+        for key_signature in (None, *range(-7, 8)):
+            table = pc_names(prefer, key_signature)
+            assert len(table) == 12
+            for pc in range(12):
+                assert table[pc] == name_for_pc(pc, prefer=prefer, key_signature=key_signature)
+
+
+def test_pc_names_key_signature_sign_overrides_preference():
+    assert pc_names("sharps", -3)[10] == "Bb"
+    assert pc_names("flats", 2)[6] == "F#"
+    assert pc_names("flats", 0)[1] == "Db"
+
+
+def test_name_table_matches_the_spelling_policy_run_directly():
+    from mts.core.enharmonics import _policy_name
+
+    for pc in range(-12, 24):
+        for prefer in ("auto", "sharps", "flats"):
+            for key_signature in (None, -2, 0, 3):
+                eff = prefer if not key_signature else ("sharps" if key_signature > 0 else "flats")
+                expected = _policy_name(PC_TO_NAMES[pc % 12], eff)
+                assert name_for_pc(pc, prefer=prefer, key_signature=key_signature) == expected
+
+
+def test_pc_from_name_fast_path_agrees_with_normalized_lookup():
+    for key, pc in _NAME_TO_PC_CI.items():
+        assert _NAME_TO_PC[_normalize_note_str(key)] == pc
+    assert pc_from_name(" eb ") == 3
+    assert pc_from_name("F♯") == 6  # unicode still goes through normalization
+    assert pc_from_name("BB") == 10
+    with pytest.raises(ValueError):
+        pc_from_name("H")
+
+
+def test_name_tables_cover_exactly_the_listed_spellings():
+    from mts.core.enharmonics import _NAME_TO_PC, _NAME_TO_PC_CI
+
+    derived = {name: pc for pc, names in PC_TO_NAMES.items() for name in names}
+    assert dict(_NAME_TO_PC) == derived
+    assert dict(_NAME_TO_PC_CI) == {**{n.lower(): pc for n, pc in derived.items()}, **derived}
+
+
+def test_public_pc_to_names_is_still_a_pc_keyed_mapping():
+    assert sorted(PC_TO_NAMES.keys()) == list(range(12))
+    assert PC_TO_NAMES.get(1) == ("C#", "Db")
+    assert PC_TO_NAMES.get(12) is None
@@ -20,7 +20,7 @@ from mts.analysis import ChordAnalysisRequest, analyze_chord, chord_brief
 from mts.analysis.voicings import suggest_voicings
 from mts.core.chord import Chord
 from mts.core.pitch import Pitch
-from mts.io.loaders import load_scales, load_chord_qualities
+from mts.io.loaders import load_chord_qualities, load_function_mappings, load_scales
 
 
 @pytest.fixture(autouse=True)
@@ -214,6 +214,30 @@ def test_chord_brief_contains_expected_components():
     assert isinstance(brief.compatible_scales, list)
 
 
+def test_chord_brief_fingerprint_matches_full_analysis():
+    # The brief's fingerprint is mask-cached; it must still equal the one read
+    # off a full analyze_chord of the rooted chord, for every catalog quality.
+    from mts.analysis.summaries import _format_interval_fingerprint
+
+    for quality in load_chord_qualities().values():
+        analysis = analyze_chord(ChordAnalysisRequest(chord=Chord.from_quality(0, quality)))
+        expected = _format_interval_fingerprint(analysis.interval_class_histogram, limit=3)
+        assert chord_brief(quality).interval_fingerprint == expected
+
+
+def test_chord_brief_roles_match_a_linear_scan_of_the_mappings():
+    # The role index is built once per loaded mapping set; it must list the
+    # same descriptors, in the same order, as scanning every mapping.
+    for quality in load_chord_qualities().values():
+        expected: list[str] = []
+        for mode in ("major", "minor"):
+            for mapping in load_function_mappings(mode):
+                descriptor = f"{mode}: {mapping.modal_label} ({mapping.role})"
+                if mapping.chord_quality == quality.name and descriptor not in expected:
+                    expected.append(descriptor)
+        assert chord_brief(quality).functional_roles == expected
+
+
 # --- RE-3g: loads itemize what they skip; nothing vanishes silently ----------------------
 
 
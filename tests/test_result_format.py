@@ -79,3 +79,32 @@ def test_display_view_to_dict():
     assert d["root_name"] == "C"
     assert d["note_names"] == ["C", "E", "G", "Bb"]
     assert isinstance(d["enharmonics"], list)
+
+
+def test_format_pcs_matches_resolve_label_per_pc():
+    from mts.context.formatters import format_pcs, resolve_label
+
+    for tonic, root in ((None, None), (2, None), (None, 9), (7, 4)):
+        for spelling in ("auto", "flats"):
+            ctx = _ctx(spelling)
+            ctx.set("tonic_pc", tonic)
+            ctx.set("chord_root_pc", root)
+            pcs = list(range(-3, 15))
+            for mode in (None, "names", "degrees", "intervals", "semitones"):
+                assert format_pcs(pcs, ctx, mode=mode) == [
+                    resolve_label(pc, ctx, mode=mode) for pc in pcs
+                ]
+
+
+def test_label_resolver_is_cached_per_context_version():
+    from mts.context.formatters import label_resolver
+
+    ctx = _ctx("flats", tonic_pc=2)
+    first = label_resolver(ctx)
+    assert label_resolver(ctx) is first
+    assert first.labels([1, 3, 6], mode="names") == ["Db", "Eb", "Gb"]
+    assert first.label(6, mode="degrees") == "3"
+    ctx.set("spelling", "sharps", layer="cli")
+    fresh = label_resolver(ctx)
+    assert fresh is not first
+    assert fresh.labels([1, 3, 6], mode="names") == ["C#", "D#", "F#"]
@@ -55,3 +55,36 @@ def test_pentatonic_shape_is_invariant_too():
     b = tuple(analyze_scale(ScaleAnalysisRequest(scale=penta.transpose(3))).step_pattern)
     assert a == b
     assert sum(a) == 12  # steps close the octave
+
+
+def test_mask_cached_step_pattern_matches_direct_computation():
+    # The mask-keyed cache must agree with the from-degrees rotation for every
+    # identity, and hand back a fresh list (callers own the result).
+    from mts.analysis.scale_analysis import _ascending_steps, _step_pattern
+    from mts.core.bitmask import pcs_from_mask
+
+    for mask in range(4096):
+        pcs = pcs_from_mask(mask)
+        steps = _ascending_steps(pcs)
+        expected = min((steps[i:] + steps[:i] for i in range(len(steps))), default=[])
+        assert _step_pattern(pcs) == expected
+    assert _step_pattern([0, 4, 7]) is not _step_pattern([0, 4, 7])
+
+
+def test_cached_modes_are_fresh_per_call():
+    # Mode rows are cached per mask, but each result owns its lists.
+    a = analyze_scale(ScaleAnalysisRequest(scale=_major(0))).modes
+    b = analyze_scale(ScaleAnalysisRequest(scale=_major(0))).modes
+    assert a == b
+    a[0].degrees.append(99)
+    assert 99 not in b[0].degrees
+
+
+def test_transpose_matches_rebuilt_scale_and_is_shared():
+    major = Scale.from_degrees("major", [0, 2, 4, 5, 7, 9, 11], ["ionian"])
+    for t in (-13, -1, 0, 3, 14):
+        rebuilt = Scale.from_degrees(
+            f"major+{t}", [(pc + t) % 12 for pc in major.degrees], major.aliases
+        )
+        assert major.transpose(t) == rebuilt
+    assert major.transpose(5) is major.transpose(5)